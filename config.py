@@ -5,6 +5,7 @@ used by the automatic detection system for the 'Continue' message.
 """
 
 import time
+from collections import deque
 import pytesseract
 import pyautogui
 
@@ -35,6 +36,8 @@ pyautogui.PAUSE = PAUSE_BETWEEN_ACTIONS
 # Configurations for automatic retries
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
+RETRY_BACKOFF_FACTOR = 1.5  # delay multiplier applied after each failed attempt
+RETRY_JITTER = 0.1  # random extra delay, as a fraction of the current delay
 CLICK_VALIDATION_TIMEOUT = 2  # seconds
 SCREENSHOT_MAX_RETRIES = 3
 
@@ -52,6 +55,16 @@ SCAN_INTERVAL = 120  # 2 minutes in seconds
 # System status report frequency
 STATUS_REPORT_FREQUENCY = 10  # every N scans
 
+# Adaptive enhancement variants: once enough successful scans have been seen,
+# only variants that contributed to a detection are run (plus random exploration).
+# Every scan without a hit counts as a miss, so pruning only covers the first
+# FALLBACK_MISSES - 1 scans after each hit; on a mostly idle screen nearly all
+# scans run the full set, and the saving comes from busy periods with frequent hits
+ADAPTIVE_VARIANTS_WARMUP = 50  # successful scans before variants are skipped
+ADAPTIVE_VARIANTS_MIN_SCORE = 1  # contributions needed to keep a variant
+ADAPTIVE_VARIANTS_EXPLORATION = 0.1  # probability of running a skipped variant anyway
+ADAPTIVE_VARIANTS_FALLBACK_MISSES = 3  # consecutive misses before all variants run again
+
 # ============================================================================
 # OCR CONFIGURATIONS
 # ============================================================================
@@ -69,6 +82,9 @@ OCR_CONFIGS = [
 # Minimum confidence threshold to accept a detection
 MIN_CONFIDENCE_THRESHOLD = 15
 
+# Maximum number of Tesseract processes run concurrently (None = CPU count)
+OCR_CONCURRENCY = None
+
 # ============================================================================
 # DEDUPLICATION CONFIGURATIONS
 # ============================================================================
@@ -122,6 +138,12 @@ SCREENSHOT_ENHANCED_PATTERN = "debug_enhanced_{method_name}_{timestamp}.png"
 # Main log file
 LOG_FILE = "log.txt"
 
+# Write DEBUG messages (disabled by default, enable with --debug)
+DEBUG_LOGGING = False
+
+# Write INFO messages such as per-scan summaries (disable for quiet headless runs)
+INFO_LOGGING = True
+
 # Timestamp format for logs
 TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
 FILE_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
@@ -169,7 +191,8 @@ def get_initial_stats():
         'last_click_time': None,
         'performance_metrics': {
             'avg_scan_time': 0,
-            'scan_times': [],
+            'scan_times': deque(maxlen=MAX_SCAN_TIMES_HISTORY),
+            'scan_times_sum': 0.0,
             'max_scan_time': 0,
             'min_scan_time': float('inf')
         }
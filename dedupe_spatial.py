@@ -0,0 +1,72 @@
+"""Module for spatial hashing of detection centers.
+
+This module provides:
+- A uniform grid that buckets points by cell
+- Proximity queries limited to the 3x3 neighbourhood of a cell
+"""
+
+from collections import defaultdict
+
+
+class DetectionGrid:
+    """Spatial hash grid of kept points.
+
+    Points are bucketed into square cells of side `cell`. As long as the
+    query radius is not larger than the cell size, every point within the
+    radius lies in the 3x3 block of cells around the query point.
+    """
+
+    def __init__(self, cell):
+        """Initializes an empty grid.
+
+        Args:
+            cell (float): Cell size, at least the largest query radius
+        """
+        self.cell = max(cell, 1)
+        self.buckets = defaultdict(list)
+
+    def key(self, x, y):
+        """Returns the cell containing a point.
+
+        Args:
+            x (float): X coordinate
+            y (float): Y coordinate
+
+        Returns:
+            tuple: (gx, gy) cell indices
+        """
+        return int(x // self.cell), int(y // self.cell)
+
+    def add(self, x, y):
+        """Adds a point to the grid.
+
+        Args:
+            x (float): X coordinate
+            y (float): Y coordinate
+        """
+        self.buckets[self.key(x, y)].append((x, y))
+
+    def has_neighbor(self, x, y, radius_sq, inclusive=False):
+        """Checks whether a stored point lies within a radius of (x, y).
+
+        Args:
+            x (float): X coordinate
+            y (float): Y coordinate
+            radius_sq (float): Squared radius
+            inclusive (bool, optional): Whether points exactly at the radius count
+
+        Returns:
+            bool: True if a stored point is within the radius
+        """
+        gx, gy = self.key(x, y)
+        buckets = self.buckets
+        for nx in (gx - 1, gx, gx + 1):
+            for ny in (gy - 1, gy, gy + 1):
+                points = buckets.get((nx, ny))
+                if not points:
+                    continue
+                for ex, ey in points:
+                    d2 = (x - ex) * (x - ex) + (y - ey) * (y - ey)
+                    if d2 < radius_sq or (inclusive and d2 == radius_sq):
+                        return True
+        return False
@@ -41,7 +41,8 @@ try:
     from logger import (
         setup_logging, log_message, log_error, log_debug,
         log_system_startup, log_system_shutdown, log_scan_interval,
-        should_log_status_report, log_system_status, get_stats_copy
+        should_log_status_report, log_system_status, get_stats_copy,
+        set_debug_enabled
     )
     from scanner import (
         perform_scan_with_retry, handle_scan_result, handle_consecutive_failures,
@@ -275,6 +276,8 @@ def main():
     
     try:
         # Setup logging
+        if args.debug:
+            set_debug_enabled(True)
         setup_logging()
         
         # Register signal handlers
@@ -37,7 +37,7 @@ from collections import deque
 from statistics_manager import get_stats_manager
 from config_manager import get_config_manager
 from logger import get_logger
-from system_controller import get_system_controller, SystemState
+from system_controller import get_system_controller, install_signal_handlers, SystemState
 
 class SystemMonitorGUI:
     """Main GUI application for system monitoring and control"""
@@ -53,6 +53,7 @@ class SystemMonitorGUI:
         self.config_manager = get_config_manager()
         self.logger = get_logger()
         self.controller = get_system_controller()
+        install_signal_handlers()
         
         # Add callbacks for system state changes
         self.controller.add_state_callback('gui', self._on_system_state_change)
@@ -9,12 +9,20 @@ This module provides complete functionality for:
 
 import os
 import time
+import threading
 import numpy as np
 from PIL import Image, ImageEnhance
 import cv2
 import pyautogui
 from datetime import datetime
 
+# mss is optional: it grabs the screen straight from the OS buffer, much faster
+# than pyautogui, which is used as fallback
+try:
+    import mss
+except ImportError:
+    mss = None
+
 from config import (
     SCREENSHOTS_FOLDER, MAX_SCREENSHOTS_TO_KEEP,
     SCREENSHOT_FULLSCREEN_PATTERN, SCREENSHOT_ENHANCED_PATTERN,
@@ -70,6 +78,27 @@ def cleanup_old_screenshots():
     except Exception as e:
         log_error(f"Error cleaning screenshots: {e}")
 
+# mss instances hold OS handles that must stay on the thread that created them
+_mss_local = threading.local()
+
+def grab_screen():
+    """Grabs the primary monitor.
+    
+    Uses a persistent per-thread mss instance when mss is installed; the raw
+    BGRA buffer is decoded straight into an RGB image with a single copy.
+    
+    Returns:
+        PIL.Image: Screenshot of the primary monitor
+    """
+    if mss is None:
+        return pyautogui.screenshot()
+    
+    sct = getattr(_mss_local, 'sct', None)
+    if sct is None:
+        sct = _mss_local.sct = mss.mss()
+    shot = sct.grab(sct.monitors[1])
+    return Image.frombytes('RGB', shot.size, shot.bgra, 'raw', 'BGRX')
+
 def safe_screenshot():
     """Captures a screenshot with automatic retries in case of error.
     
@@ -79,7 +108,7 @@ def safe_screenshot():
     for attempt in range(SCREENSHOT_MAX_RETRIES):
         try:
             log_debug(f"Screenshot attempt #{attempt + 1}")
-            screenshot = pyautogui.screenshot()
+            screenshot = grab_screen()
             
             if screenshot is None:
                 raise Exception("Screenshot returned None")
@@ -196,6 +225,31 @@ def pil_to_cv2(pil_image):
         log_error(f"Error converting PIL->CV2: {e}")
         return None
 
+def pil_to_gray(pil_image):
+    """Converts a PIL image to a single-channel grayscale OpenCV image.
+    
+    Uses the same luma weights as converting to BGR and then to grayscale,
+    without materializing the 3-channel BGR copy.
+    
+    Args:
+        pil_image (PIL.Image): PIL image to convert
+        
+    Returns:
+        numpy.ndarray or None: 8-bit grayscale image or None if it fails
+    """
+    try:
+        if not validate_image(pil_image):
+            return None
+        
+        if pil_image.mode != 'RGB':
+            pil_image = pil_image.convert('RGB')
+        
+        return cv2.cvtColor(np.asarray(pil_image), cv2.COLOR_RGB2GRAY)
+        
+    except Exception as e:
+        log_error(f"Error converting PIL->grayscale: {e}")
+        return None
+
 def cv2_to_pil(cv2_image):
     """Converts an OpenCV image to PIL format.
     
@@ -241,7 +295,7 @@ def enhance_with_clahe(image):
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Not modified in place: no copy needed
         
         # Apply CLAHE
         clahe = cv2.createCLAHE(
@@ -273,7 +327,7 @@ def enhance_dark_on_light(image):
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Not modified in place: no copy needed
         
         # Apply adaptive threshold
         enhanced = cv2.adaptiveThreshold(
@@ -308,7 +362,7 @@ def enhance_light_on_dark(image):
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image  # Not modified in place: no copy needed
         
         # Apply inverted adaptive threshold
         enhanced = cv2.adaptiveThreshold(
@@ -401,8 +455,9 @@ def enhance_image_for_text_detection(screenshot):
         
         log_debug(f"Starting image enhancement {screenshot.width}x{screenshot.height}")
         
-        # Convert to OpenCV format
-        cv2_image = pil_to_cv2(screenshot)
+        # Convert to grayscale once: every enhancement method works on a single
+        # channel, so the 3-channel BGR image is never needed
+        cv2_image = pil_to_gray(screenshot)
         if cv2_image is None:
             log_error("Error converting screenshot for enhancement")
             return []
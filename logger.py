@@ -9,16 +9,75 @@ This module provides complete functionality for:
 
 import time
 import os
+import atexit
+import functools
+import threading
 from datetime import datetime
 from config import (
-    LOG_FILE, TIMESTAMP_FORMAT, LOG_SEPARATOR, SUB_SEPARATOR,
-    STATUS_REPORT_FREQUENCY, MAX_SCAN_TIMES_HISTORY,
+    LOG_FILE, TIMESTAMP_FORMAT, DEBUG_LOGGING, INFO_LOGGING, LOG_SEPARATOR, SUB_SEPARATOR,
+    STATUS_REPORT_FREQUENCY,
     get_initial_stats
 )
 
 # Global system statistics
 stats = get_initial_stats()
 
+# Whether debug messages are written
+_DEBUG_ENABLED = DEBUG_LOGGING
+
+# Whether info messages are written
+_INFO_ENABLED = INFO_LOGGING
+
+# Cached log timestamp (timestamps have 1-second resolution)
+_ts_cache_sec = 0
+_ts_cache_str = ""
+
+def _get_timestamp():
+    """Returns the formatted log timestamp, recomputed at most once per second.
+    
+    Returns:
+        str: Current time formatted with TIMESTAMP_FORMAT
+    """
+    global _ts_cache_sec, _ts_cache_str
+    sec = int(time.time())
+    if sec != _ts_cache_sec:
+        _ts_cache_str = time.strftime(TIMESTAMP_FORMAT, time.localtime(sec))
+        _ts_cache_sec = sec
+    return _ts_cache_str
+
+# Log file descriptor, opened once in append mode
+_log_fd = None
+_log_fd_lock = threading.Lock()
+
+def _get_log_fd():
+    """Returns the log file descriptor, opening it on first use.
+    
+    The file is opened with O_APPEND so every os.write is a single atomic
+    append, even when several threads log at the same time.
+    
+    Returns:
+        int: File descriptor of LOG_FILE
+    """
+    global _log_fd
+    if _log_fd is None:
+        with _log_fd_lock:
+            if _log_fd is None:
+                _log_fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    return _log_fd
+
+def close_log_file():
+    """Closes the log file descriptor if it is open."""
+    global _log_fd
+    with _log_fd_lock:
+        if _log_fd is not None:
+            try:
+                os.close(_log_fd)
+            except OSError:
+                pass
+            _log_fd = None
+
+atexit.register(close_log_file)
+
 def log_message(message, level="INFO", include_separator=False):
     """Records a message in the log file with timestamp.
     
@@ -27,23 +86,47 @@ def log_message(message, level="INFO", include_separator=False):
         level (str): Log level (INFO, ERROR, WARNING, DEBUG)
         include_separator (bool): Whether to include a separator before the message
     """
+    log_lines((message,), level, include_separator)
+
+def log_lines(messages, level="INFO", include_separator=False):
+    """Records several messages with a single timestamp and a single write.
+    
+    Every message still gets its own "[timestamp] [level]" line, so the log
+    file format is the same as calling log_message for each of them.
+    
+    Args:
+        messages (list or tuple): The messages to record
+        level (str): Log level (INFO, ERROR, WARNING, DEBUG)
+        include_separator (bool): Whether to include a separator before the messages
+    """
+    if level == "INFO" and not _INFO_ENABLED:
+        return
     try:
-        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
-        log_entry = f"[{timestamp}] [{level}] {message}"
+        timestamp = _get_timestamp()
+        prefix = f"[{timestamp}] [{level}] "
+        log_entries = "\n".join(prefix + message for message in messages)
         
         # Print to console
-        print(log_entry)
+        print(log_entries)
         
-        # Write to file
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            if include_separator:
-                f.write(f"\n{LOG_SEPARATOR}\n")
-            f.write(log_entry + "\n")
+        # Write to file with a single append
+        if include_separator:
+            payload = f"\n{LOG_SEPARATOR}\n{log_entries}\n"
+        else:
+            payload = log_entries + "\n"
+        log_fd = _get_log_fd()
+        os.write(log_fd, payload.encode("utf-8"))
+        
+        # Make sure errors reach the disk
+        if level == "ERROR":
+            os.fsync(log_fd)
             
     except Exception as e:
         # Fallback: print only to console if file is not accessible
-        print(f"[{datetime.now().strftime(TIMESTAMP_FORMAT)}] [ERROR] Logging error: {e}")
-        print(f"[{datetime.now().strftime(TIMESTAMP_FORMAT)}] [{level}] {message}")
+        timestamp = _get_timestamp()
+        print(f"[{timestamp}] [ERROR] Logging error: {e}")
+        for message in messages:
+            print(f"[{timestamp}] [{level}] {message}")
 
 def log_error(message, exception=None):
     """Records an error message with optional exception details.
@@ -61,6 +144,30 @@ def log_error(message, exception=None):
     # Update error statistics
     stats['total_errors'] += 1
 
+def guarded(fallback=None):
+    """Decorator that logs and swallows exceptions raised by a function.
+    
+    The wrapped function returns `fallback` instead of raising, so callers
+    do not need their own try/except around it. The fallback object is
+    returned as is and must not be mutated by callers.
+    
+    Args:
+        fallback: Value returned when the function raises
+        
+    Returns:
+        callable: Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                log_error(f"Error in {func.__name__}: {e}")
+                return fallback
+        return wrapper
+    return decorator
+
 def log_warning(message):
     """Records a warning message.
     
@@ -69,14 +176,59 @@ def log_warning(message):
     """
     log_message(message, "WARNING")
 
-def log_debug(message):
+def log_debug(message, *args):
     """Records a debug message.
     
+    Formatting is deferred until debug logging is known to be enabled, so
+    hot paths should pass arguments instead of pre-formatting the message.
+    
     Args:
-        message (str): Debug message
+        message (str): Debug message, optionally with %-style placeholders
+        *args: Arguments for the placeholders in message
     """
+    if not _DEBUG_ENABLED:
+        return
+    if args:
+        message = message % args
     log_message(message, "DEBUG")
 
+def set_debug_enabled(enabled):
+    """Enables or disables debug messages.
+    
+    Args:
+        enabled (bool): Whether debug messages should be written
+    """
+    global _DEBUG_ENABLED
+    _DEBUG_ENABLED = bool(enabled)
+
+def is_debug_enabled():
+    """Checks whether debug messages are written.
+    
+    Returns:
+        bool: True if debug logging is enabled
+    """
+    return _DEBUG_ENABLED
+
+def set_info_enabled(enabled):
+    """Enables or disables info messages.
+    
+    Args:
+        enabled (bool): Whether info messages should be written
+    """
+    global _INFO_ENABLED
+    _INFO_ENABLED = bool(enabled)
+
+def is_info_enabled():
+    """Checks whether info messages are written.
+    
+    Callers can use this to skip building info messages that would be
+    discarded.
+    
+    Returns:
+        bool: True if info logging is enabled
+    """
+    return _INFO_ENABLED
+
 def log_startup_messages():
     """Records system startup messages."""
     from config import STARTUP_MESSAGES
@@ -123,16 +275,17 @@ def update_performance_stats(scan_time):
     try:
         metrics = stats['performance_metrics']
         
-        # Add the new time to the list
-        metrics['scan_times'].append(scan_time)
+        scan_times = metrics['scan_times']
         
-        # Keep only the last N times for efficiency
-        if len(metrics['scan_times']) > MAX_SCAN_TIMES_HISTORY:
-            metrics['scan_times'] = metrics['scan_times'][-MAX_SCAN_TIMES_HISTORY:]
+        # The bounded deque evicts the oldest time on append: keep the running sum in step
+        if len(scan_times) == scan_times.maxlen:
+            metrics['scan_times_sum'] -= scan_times[0]
+        scan_times.append(scan_time)
+        metrics['scan_times_sum'] += scan_time
         
         # Calculate statistics
-        if metrics['scan_times']:
-            metrics['avg_scan_time'] = sum(metrics['scan_times']) / len(metrics['scan_times'])
+        if scan_times:
+            metrics['avg_scan_time'] = metrics['scan_times_sum'] / len(scan_times)
             metrics['max_scan_time'] = max(metrics['max_scan_time'], scan_time)
             
             if metrics['min_scan_time'] == float('inf'):
@@ -140,7 +293,7 @@ def update_performance_stats(scan_time):
             else:
                 metrics['min_scan_time'] = min(metrics['min_scan_time'], scan_time)
         
-        log_debug(f"Scan time: {scan_time:.2f}s (Average: {metrics['avg_scan_time']:.2f}s)")
+        log_debug("Scan time: %.2fs (Average: %.2fs)", scan_time, metrics['avg_scan_time'])
         
     except Exception as e:
         log_error(f"Error updating performance statistics: {e}")
@@ -193,9 +346,21 @@ def format_uptime(uptime_seconds):
     Returns:
         str: Formatted uptime (e.g. "2h 30m 45s")
     """
-    hours = int(uptime_seconds // 3600)
-    minutes = int((uptime_seconds % 3600) // 60)
-    seconds = int(uptime_seconds % 60)
+    return _format_uptime_seconds(int(uptime_seconds))
+
+@functools.lru_cache(maxsize=1024)
+def _format_uptime_seconds(total_seconds):
+    """Formats a whole number of seconds, memoized since callers repeat values.
+    
+    Args:
+        total_seconds (int): Uptime in whole seconds
+        
+    Returns:
+        str: Formatted uptime (e.g. "2h 30m 45s")
+    """
+    hours = total_seconds // 3600
+    minutes = (total_seconds % 3600) // 60
+    seconds = total_seconds % 60
     
     if hours > 0:
         return f"{hours}h {minutes}m {seconds}s"
@@ -244,36 +409,39 @@ def log_system_status():
         uptime = get_uptime()
         success_rate = calculate_success_rate()
         
-        log_message("", include_separator=True)
-        log_message("📊 SYSTEM STATUS REPORT")
-        log_message(f"⏱️ Uptime: {format_uptime(uptime)}")
-        log_message(f"🔍 Total scans: {stats['total_scans']}")
-        log_message(f"✅ Successful detections: {stats['successful_detections']}")
-        log_message(f"❌ Failed scans: {stats['failed_scans']}")
-        log_message(f"📈 Success rate: {success_rate:.1f}%")
-        log_message(f"🖱️ Clicks performed: {stats['clicks_performed']}")
-        log_message(f"🔄 Consecutive failures: {stats['consecutive_failures']}")
-        log_message(f"📊 Max consecutive failures: {stats['max_consecutive_failures']}")
-        
-        # Error statistics
-        log_message(f"🚨 Total errors: {stats['total_errors']}")
-        log_message(f"  📸 Screenshot errors: {stats['screenshot_errors']}")
-        log_message(f"  🔍 OCR errors: {stats['ocr_errors']}")
-        log_message(f"  🖱️ Click errors: {stats['click_errors']}")
-        log_message(f"  🎨 Enhancement errors: {stats['enhancement_errors']}")
+        lines = [
+            "",
+            "📊 SYSTEM STATUS REPORT",
+            f"⏱️ Uptime: {format_uptime(uptime)}",
+            f"🔍 Total scans: {stats['total_scans']}",
+            f"✅ Successful detections: {stats['successful_detections']}",
+            f"❌ Failed scans: {stats['failed_scans']}",
+            f"📈 Success rate: {success_rate:.1f}%",
+            f"🖱️ Clicks performed: {stats['clicks_performed']}",
+            f"🔄 Consecutive failures: {stats['consecutive_failures']}",
+            f"📊 Max consecutive failures: {stats['max_consecutive_failures']}",
+            
+            # Error statistics
+            f"🚨 Total errors: {stats['total_errors']}",
+            f"  📸 Screenshot errors: {stats['screenshot_errors']}",
+            f"  🔍 OCR errors: {stats['ocr_errors']}",
+            f"  🖱️ Click errors: {stats['click_errors']}",
+            f"  🎨 Enhancement errors: {stats['enhancement_errors']}",
+        ]
         
         # Performance metrics
         metrics = stats['performance_metrics']
         if metrics['scan_times']:
-            log_message(f"⚡ Scan performance:")
-            log_message(f"  📊 Average time: {metrics['avg_scan_time']:.2f}s")
-            log_message(f"  ⚡ Minimum time: {metrics['min_scan_time']:.2f}s")
-            log_message(f"  🐌 Maximum time: {metrics['max_scan_time']:.2f}s")
+            lines.append("⚡ Scan performance:")
+            lines.append(f"  📊 Average time: {metrics['avg_scan_time']:.2f}s")
+            lines.append(f"  ⚡ Minimum time: {metrics['min_scan_time']:.2f}s")
+            lines.append(f"  🐌 Maximum time: {metrics['max_scan_time']:.2f}s")
         
         # Last activity times
-        log_message(f"🕐 Last detection: {get_time_since_last_detection()} ago")
-        log_message(f"🕐 Last click: {get_time_since_last_click()} ago")
+        lines.append(f"🕐 Last detection: {get_time_since_last_detection()} ago")
+        lines.append(f"🕐 Last click: {get_time_since_last_click()} ago")
         
+        log_lines(lines, include_separator=True)
         log_message("", include_separator=True)
         
     except Exception as e:
@@ -300,6 +468,18 @@ def get_stats_copy():
     """
     return stats.copy()
 
+def get_stat(key, default=None):
+    """Returns a single statistic without copying the statistics dict.
+    
+    Args:
+        key (str): Statistic name
+        default: Value returned when the statistic is missing
+        
+    Returns:
+        Current value of the statistic
+    """
+    return stats.get(key, default)
+
 def log_scan_start(scan_number):
     """Logs the start of a new scan.
     
@@ -328,7 +508,7 @@ def log_enhancement_stats(method_name, detections_count):
         method_name (str): Enhancement method name
         detections_count (int): Number of detections found
     """
-    log_debug(f"Enhancement {method_name}: {detections_count} valid detections")
+    log_debug("Enhancement %s: %d valid detections", method_name, detections_count)
 
 def log_coordinates_found(word, coordinates):
     """Logs the finding of coordinates for a word.
@@ -370,7 +550,7 @@ def log_system_startup():
     """Logs system startup with detailed information."""
     log_message("🚀 Automatic detection system started", include_separator=True)
     log_message(f"📁 Log file: {LOG_FILE}")
-    log_message(f"⏰ Startup: {datetime.now().strftime(TIMESTAMP_FORMAT)}")
+    log_message(f"⏰ Startup: {_get_timestamp()}")
 
 def log_system_shutdown():
     """Logs system shutdown."""
@@ -384,14 +564,6 @@ def log_scan_interval(scan_number, interval_minutes):
     """Logs scan interval."""
     log_message(f"⏰ Next scan #{scan_number} in {interval_minutes} minutes...")
 
-def should_log_status_report():
-    """Determines if it's time to log a status report."""
-    return stats['total_scans'] % STATUS_REPORT_FREQUENCY == 0
-
-def get_stats_copy():
-    """Returns a copy of current statistics."""
-    return stats.copy()
-
 def get_logger():
     """Returns a logger-like object with standard logging methods.
     
@@ -7,12 +7,51 @@ This module provides complete functionality for:
 - Detection deduplication
 """
 
+import os
 import re
+import array
+import bisect
+import functools
+import itertools
+import tempfile
+import threading
+import atexit
+import contextlib
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+
+# Several Tesseract processes run in parallel (one per configuration): keep each
+# one single-threaded so their OpenMP pools do not oversubscribe the CPU.
+# Set before tesserocr (and NumPy) load, since the OpenMP runtime reads it when
+# it initialises; Tesseract subprocesses inherit it. An explicit user value wins.
+os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+
+import numpy as np
 import pytesseract
 from PIL import Image
 
+# tesserocr is optional: when installed, OCR runs in-process through persistent
+# Tesseract API instances instead of launching the tesseract binary per call
+try:
+    from tesserocr import PyTessBaseAPI, PSM, OEM, RIL, iterate_level
+except ImportError:
+    PyTessBaseAPI = None
+
+# SciPy is optional: it only speeds up deduplication of very large coordinate sets
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Numba is optional: when present the coordinate deduplication loop is compiled
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 from config import (
-    OCR_CONFIGS, MIN_CONFIDENCE_THRESHOLD,
+    OCR_CONFIGS, OCR_CONCURRENCY, MIN_CONFIDENCE_THRESHOLD,
     DEDUPLICATION_DISTANCE_THRESHOLD, FINAL_COORDINATES_TOLERANCE
 )
 from logger import (
@@ -20,21 +59,246 @@ from logger import (
     record_ocr_error
 )
 from image_processing import validate_image
+from dedupe_spatial import DetectionGrid
+
+# Temporary OCR images go to a RAM-backed directory when the system has one,
+# so the single encode per image never touches the disk
+_OCR_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+
+# Squared thresholds: distances are only compared, so the square root is never needed
+_THRESH_SQ = DEDUPLICATION_DISTANCE_THRESHOLD ** 2
+_TOL_SQ = FINAL_COORDINATES_TOLERANCE ** 2
+
+# Maximum distance (pixels) between "Continue" and the end word in the direct search
+DIRECT_SEARCH_RADIUS = 200
+_DIRECT_SEARCH_RADIUS_SQ = DIRECT_SEARCH_RADIUS ** 2
+
+# Above this many coordinates a KD-tree (or a grid hash without SciPy) is used
+# instead of a full distance matrix
+KDTREE_MIN_COORDINATES = 256
+
+# Possible OCR readings of the final word ("to" is often read as "t0")
+END_WORDS = ('to', 't0')
+
+@functools.lru_cache(maxsize=8)
+def _compile_end_word_patterns(flags=re.IGNORECASE):
+    """Compiles the whole-word patterns of the possible end words.
+    
+    Args:
+        flags (int, optional): Regex flags applied to the patterns
+        
+    Returns:
+        tuple: Tuple of (end_word, compiled word pattern)
+    """
+    return tuple(
+        (end_word, re.compile(r'\b' + re.escape(end_word) + r'\b', flags))
+        for end_word in END_WORDS
+    )
+
+@functools.lru_cache(maxsize=256)
+def _compile_patterns(target_pattern, flags=re.IGNORECASE):
+    """Compiles the target pattern and the end word patterns once per target.
+    
+    Args:
+        target_pattern (str or re.Pattern): Regex pattern to search for; an
+            already compiled pattern is used as is
+        flags (int, optional): Regex flags applied to all patterns
+        
+    Returns:
+        tuple: (compiled target pattern, tuple of (end_word, compiled word pattern))
+    """
+    if isinstance(target_pattern, re.Pattern):
+        return target_pattern, _compile_end_word_patterns(flags)
+    return re.compile(target_pattern, flags), _compile_end_word_patterns(flags)
+
+def _greedy_keep_kernel(xs, ys, kept_xs, kept_ys, tolerance_sq):
+    """Greedy keep-first pass over coordinates without a distance matrix.
+    
+    Written with explicit loops so it can be compiled by Numba.
+    
+    Args:
+        xs (np.ndarray): Candidate x coordinates
+        ys (np.ndarray): Candidate y coordinates
+        kept_xs (np.ndarray): x coordinates as stored when kept (truncated)
+        kept_ys (np.ndarray): y coordinates as stored when kept (truncated)
+        tolerance_sq (float): Squared duplicate tolerance
+        
+    Returns:
+        np.ndarray: Boolean mask of coordinates to keep
+    """
+    n = xs.shape[0]
+    keep = np.ones(n, dtype=np.bool_)
+    for i in range(n):
+        if keep[i]:
+            for j in range(i + 1, n):
+                if keep[j]:
+                    dx = xs[j] - kept_xs[i]
+                    dy = ys[j] - kept_ys[i]
+                    if dx * dx + dy * dy <= tolerance_sq:
+                        keep[j] = False
+    return keep
+
+if njit is not None:
+    _greedy_keep_kernel = njit(cache=True, fastmath=True)(_greedy_keep_kernel)
+
+def save_image_for_ocr(image):
+    """Writes an image once to a temporary BMP file that Tesseract can read.
+    
+    Passing the file path to pytesseract avoids re-encoding the image for
+    every OCR configuration. The caller is responsible for removing the file.
+    
+    Args:
+        image (PIL.Image): Image to save
+        
+    Returns:
+        str: Path of the temporary file
+    """
+    fd, path = tempfile.mkstemp(prefix='ocr_', suffix='.bmp', dir=_OCR_TEMP_DIR)
+    os.close(fd)
+    try:
+        image.save(path, 'BMP')
+    except Exception:
+        os.remove(path)
+        raise
+    return path
 
-def extract_text_with_single_config(image, config):
+# Idle persistent tesserocr API instances keyed by (oem, variables).
+# Configurations that differ only in --psm share instances (and so their
+# loaded language model); concurrent calls each take their own instance.
+_tess_idle_apis = defaultdict(list)
+_tess_all_apis = []
+_tess_apis_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=64)
+def _parse_tesseract_config(config):
+    """Parses a Tesseract command line configuration string.
+    
+    Args:
+        config (str): Configuration such as '--psm 6 --oem 1 -c name=value'
+        
+    Returns:
+        tuple: (psm, oem, tuple of (variable, value))
+    """
+    psm = PSM.AUTO
+    oem = OEM.DEFAULT
+    variables = []
+    tokens = config.split()
+    for flag, value in zip(tokens, tokens[1:]):
+        if flag == '--psm':
+            psm = int(value)
+        elif flag == '--oem':
+            oem = int(value)
+        elif flag == '-c' and '=' in value:
+            variables.append(tuple(value.split('=', 1)))
+    return psm, oem, tuple(variables)
+
+@contextlib.contextmanager
+def _tess_api(config):
+    """Borrows a persistent tesserocr API set up for a configuration.
+    
+    An idle instance with the same OEM and variables is reused and only its
+    page segmentation mode is changed; a new one is created when none is idle.
+    
+    Args:
+        config (str): OCR configuration
+        
+    Yields:
+        PyTessBaseAPI: API instance reserved for the caller
+    """
+    psm, oem, variables = _parse_tesseract_config(config)
+    key = (oem, variables)
+    with _tess_apis_lock:
+        idle = _tess_idle_apis[key]
+        api = idle.pop() if idle else None
+    
+    if api is None:
+        api = PyTessBaseAPI(oem=oem)
+        for name, value in variables:
+            api.SetVariable(name, value)
+        with _tess_apis_lock:
+            _tess_all_apis.append(api)
+    
+    try:
+        api.SetPageSegMode(psm)
+        yield api
+    finally:
+        with _tess_apis_lock:
+            _tess_idle_apis[key].append(api)
+
+def close_tess_apis():
+    """Releases all persistent tesserocr API instances."""
+    with _tess_apis_lock:
+        for api in _tess_all_apis:
+            try:
+                api.End()
+            except Exception:
+                pass
+        _tess_all_apis.clear()
+        _tess_idle_apis.clear()
+
+atexit.register(close_tess_apis)
+
+def _image_to_data_with_api(image, config):
+    """Runs OCR through a persistent tesserocr API and returns Tesseract dict data.
+    
+    Args:
+        image (PIL.Image or str): Image to process, or path of an image file
+        config (str): OCR configuration to use
+        
+    Returns:
+        dict: Word-level columns text, conf, left, top, width, height, limited
+            to words meeting MIN_CONFIDENCE_THRESHOLD
+    """
+    data = {key: [] for key in ('text', 'conf', 'left', 'top', 'width', 'height')}
+    with _tess_api(config) as api:
+        if isinstance(image, str):
+            api.SetImageFile(image)
+        else:
+            api.SetImage(image)
+        api.Recognize()
+        
+        iterator = api.GetIterator()
+        if iterator is None:
+            return data
+        
+        for word in iterate_level(iterator, RIL.WORD):
+            # Check confidence before decoding the word's UTF-8 text: most
+            # low-confidence tokens are dropped without any string work
+            confidence = word.Confidence(RIL.WORD)
+            if confidence < MIN_CONFIDENCE_THRESHOLD:
+                continue
+            box = word.BoundingBox(RIL.WORD)
+            if box is None:
+                continue
+            x1, y1, x2, y2 = box
+            data['text'].append(word.GetUTF8Text(RIL.WORD) or '')
+            data['conf'].append(confidence)
+            data['left'].append(x1)
+            data['top'].append(y1)
+            data['width'].append(x2 - x1)
+            data['height'].append(y2 - y1)
+    return data
+
+def extract_text_with_single_config(image, config, use_api=True):
     """Extracts text from an image using a single OCR configuration.
     
     Args:
-        image (PIL.Image): Image to process
+        image (PIL.Image or str): Image to process, or path of an image file
+            (or of a text file listing image paths) to pass to Tesseract
         config (str): OCR configuration to use
+        use_api (bool, optional): Use the persistent tesserocr API when it is
+            installed; False always runs the tesseract binary via pytesseract
         
     Returns:
         dict or None: OCR data or None if it fails
     """
     try:
-        if not validate_image(image):
+        if not isinstance(image, str) and not validate_image(image):
             return None
         
+        if use_api and PyTessBaseAPI is not None:
+            return _image_to_data_with_api(image, config)
+        
         # Execute OCR with the specified configuration
         data = pytesseract.image_to_data(
             image,
@@ -48,6 +312,9 @@ def extract_text_with_single_config(image, config):
         log_error(f"OCR error with config '{config}': {e}")
         return None
 
+# Keys that Tesseract's dict output must contain
+OCR_DATA_KEYS = frozenset(('text', 'left', 'top', 'width', 'height', 'conf'))
+
 def validate_ocr_data(data):
     """Validates OCR data returned by Tesseract.
     
@@ -62,70 +329,136 @@ def validate_ocr_data(data):
             return False
         
         # Check that necessary keys are present
-        required_keys = ['text', 'left', 'top', 'width', 'height', 'conf']
-        for key in required_keys:
-            if key not in data:
-                return False
-            if not isinstance(data[key], list):
-                return False
-        
-        # Check that all lists have the same length
-        lengths = [len(data[key]) for key in required_keys]
-        if not all(length == lengths[0] for length in lengths):
+        if not OCR_DATA_KEYS.issubset(data.keys()):
             return False
         
-        return True
+        # Check that all columns have the same length as the text column
+        n = len(data['text'])
+        return not any(len(data[key]) != n for key in ('left', 'top', 'width', 'height', 'conf'))
         
     except Exception:
         return False
 
-def process_single_detection(i, data):
-    """Processes a single OCR detection.
+def process_detections(data):
+    """Processes all detections of an OCR result in a single vectorized pass.
+    
+    Tesseract returns columnar lists, so confidence and bounds are filtered
+    with NumPy masks and dicts are only built for the surviving indices.
     
     Args:
-        i (int): Detection index
         data (dict): Complete OCR data
         
     Returns:
-        dict or None: Processed detection or None if invalid
+        list: List of valid detections
     """
+    conf = np.asarray(data['conf'], dtype=np.float64)
+    left = np.asarray(data['left'], dtype=np.int64)
+    top = np.asarray(data['top'], dtype=np.int64)
+    width = np.asarray(data['width'], dtype=np.int64)
+    height = np.asarray(data['height'], dtype=np.int64)
+    
+    # Confidence and coordinate validation
+    mask = (conf >= MIN_CONFIDENCE_THRESHOLD) & (left >= 0) & (top >= 0) & (width > 0) & (height > 0)
+    idx = np.flatnonzero(mask)
+    
+    conf, left, top, width, height = conf[idx], left[idx], top[idx], width[idx], height[idx]
+    
+    # Calculate center coordinates
+    center_x = left + width // 2
+    center_y = top + height // 2
+    
+    # Convert the surviving columns to Python scalars in bulk, not per element
+    texts = data['text']
+    columns = zip(
+        idx.tolist(), conf.tolist(), left.tolist(), top.tolist(),
+        width.tolist(), height.tolist(), center_x.tolist(), center_y.tolist()
+    )
+    
+    detections = []
+    for i, c, l, t, w, h, cx, cy in columns:
+        text = texts[i].strip()
+        if not text:
+            continue
+        
+        detections.append({
+            'text': text,
+            'confidence': c,
+            'left': l,
+            'top': t,
+            'width': w,
+            'height': h,
+            'center_x': cx,
+            'center_y': cy,
+            '_key': text.casefold()
+        })
+    
+    return detections
+
+def iter_all_detections(image):
+    """Yields all text detections with positions from an image, configuration by configuration.
+    
+    Detections are produced as each configuration's results are processed,
+    without accumulating an intermediate list for the whole image.
+    
+    Args:
+        image (PIL.Image): Image to process
+        
+    Yields:
+        dict: Valid detection
+    """
+    total = 0
+    
     try:
-        text = data['text'][i].strip()
-        confidence = data['conf'][i]
-        left = data['left'][i]
-        top = data['top'][i]
-        width = data['width'][i]
-        height = data['height'][i]
-        
-        # Basic validation
-        if not text or confidence < MIN_CONFIDENCE_THRESHOLD:
-            return None
+        # Input validation
+        if not validate_image(image):
+            log_error("Invalid image for text extraction")
+            return
         
-        # Coordinate validation
-        if not all(isinstance(val, (int, float)) for val in [left, top, width, height]):
-            return None
+        log_debug("Starting text extraction from image %dx%d", image.width, image.height)
         
-        if left < 0 or top < 0 or width <= 0 or height <= 0:
-            return None
+        # Encode the image once and share the file between all configurations
+        image_path = save_image_for_ocr(image)
+        try:
+            # Run all OCR configurations concurrently: each one waits on its own
+            # Tesseract subprocess, so the threads spend their time outside the GIL
+            max_workers = min(len(OCR_CONFIGS), OCR_CONCURRENCY or os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda config: extract_text_with_single_config(image_path, config),
+                    OCR_CONFIGS
+                ))
+        finally:
+            try:
+                os.remove(image_path)
+            except OSError as e:
+                log_error(f"Error removing temporary OCR image {image_path}: {e}")
         
-        # Calculate center coordinates
-        center_x = int(left + width // 2)
-        center_y = int(top + height // 2)
+        # Process results in configuration order
+        for config, data in zip(OCR_CONFIGS, results):
+            try:
+                log_debug("OCR results for config: %s", config)
+                
+                if not validate_ocr_data(data):
+                    log_debug("Invalid OCR data for config: %s", config)
+                    continue
+                
+                # Process all detections in one vectorized pass
+                detections = process_detections(data)
+                log_debug("Config %s: %d valid detections", config, len(detections))
+                
+            except Exception as e:
+                log_error(f"OCR error with configuration {config}: {e}")
+                record_ocr_error()
+                continue
+            
+            total += len(detections)
+            yield from detections
         
-        return {
-            'text': text,
-            'confidence': float(confidence),
-            'left': int(left),
-            'top': int(top),
-            'width': int(width),
-            'height': int(height),
-            'center_x': center_x,
-            'center_y': center_y
-        }
+        log_debug("Text extraction completed: %d total detections", total)
         
     except Exception as e:
-        log_error(f"Error processing detection {i}: {e}")
-        return None
+        log_error(f"Critical error during text extraction: {e}")
+        record_ocr_error()
 
 def extract_all_text_with_positions(image):
     """Extracts all text with positions from an image using multiple OCR configurations.
@@ -136,57 +469,123 @@ def extract_all_text_with_positions(image):
     Returns:
         list: List of valid detections
     """
-    all_detections = []
+    return list(iter_all_detections(image))
+
+def split_ocr_data_by_page(data, page_count):
+    """Splits multi-page Tesseract dict output into one dict per page.
+    
+    Args:
+        data (dict): OCR data containing a 'page_num' column (1-based)
+        page_count (int): Number of pages (images) that were submitted
+        
+    Returns:
+        list: One OCR data dict per page, in submission order
+    """
+    pages = np.asarray(data['page_num'], dtype=np.int64)
+    per_page = []
+    for page in range(1, page_count + 1):
+        idx = np.flatnonzero(pages == page).tolist()
+        per_page.append({key: [data[key][i] for i in idx] for key in OCR_DATA_KEYS})
+    return per_page
+
+# Shared pool for OCR of whole images, created on first use
+_image_pool = None
+_image_pool_lock = threading.Lock()
+
+def _get_image_pool():
+    """Returns the shared thread pool used to OCR several images in parallel.
+    
+    Each image already runs its OCR configurations on its own threads, so the
+    pool is limited to a quarter of the CPUs.
+    
+    Returns:
+        ThreadPoolExecutor: Shared executor
+    """
+    global _image_pool
+    with _image_pool_lock:
+        if _image_pool is None:
+            _image_pool = ThreadPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 1) // 4),
+                thread_name_prefix='ocr-image'
+            )
+        return _image_pool
+
+def extract_all_text_with_positions_batch(images):
+    """Extracts text with positions from several images, one Tesseract run per configuration.
+    
+    All images are written to a temporary directory and listed in a text file
+    that is handed to Tesseract as a single input, so process startup is paid
+    once per configuration instead of once per image and configuration.
+    
+    Args:
+        images (list): List of PIL.Image images to process
+        
+    Returns:
+        list: One list of valid detections per input image (empty on error)
+    """
+    # In-process tesserocr has no startup cost to amortize: process the images
+    # in parallel instead, each one running its configurations concurrently
+    if PyTessBaseAPI is not None:
+        return list(_get_image_pool().map(extract_all_text_with_positions, images))
+    
+    results = [[] for _ in images]
     
     try:
-        # Input validation
-        if not validate_image(image):
-            log_error("Invalid image for text extraction")
-            return []
+        valid_indices = [i for i, image in enumerate(images) if validate_image(image)]
+        if not valid_indices:
+            log_error("No valid images for batch text extraction")
+            return results
+        
+        log_debug("Starting batch text extraction for %d images", len(valid_indices))
         
-        log_debug(f"Starting text extraction from image {image.width}x{image.height}")
+        with tempfile.TemporaryDirectory(prefix='ocr_batch_', dir=_OCR_TEMP_DIR) as temp_dir:
+            # Tesseract reads a .txt input as a list of image paths, one per line
+            list_path = os.path.join(temp_dir, 'images.txt')
+            with open(list_path, 'w', encoding='utf-8') as list_file:
+                for i in valid_indices:
+                    image_path = os.path.join(temp_dir, f'image_{i}.bmp')
+                    images[i].save(image_path, 'BMP')
+                    list_file.write(image_path + '\n')
+            
+            max_workers = min(len(OCR_CONFIGS), OCR_CONCURRENCY or os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                batch_data = list(executor.map(
+                    # Image lists are a tesseract command line feature: skip the API
+                    lambda config: extract_text_with_single_config(list_path, config, use_api=False),
+                    OCR_CONFIGS
+                ))
         
-        # Try all OCR configurations
-        for config in OCR_CONFIGS:
+        # Process results in configuration order, one page per submitted image
+        for config, data in zip(OCR_CONFIGS, batch_data):
             try:
-                log_debug(f"OCR attempt with config: {config}")
-                
-                # Extract OCR data
-                data = extract_text_with_single_config(image, config)
-                if not validate_ocr_data(data):
-                    log_debug(f"Invalid OCR data for config: {config}")
+                if not validate_ocr_data(data) or 'page_num' not in data:
+                    log_debug("Invalid batch OCR data for config: %s", config)
                     continue
                 
-                # Process each detection
-                valid_detections = 0
-                for i in range(len(data['text'])):
-                    try:
-                        detection = process_single_detection(i, data)
-                        if detection:
-                            all_detections.append(detection)
-                            valid_detections += 1
-                    except Exception as e:
-                        log_error(f"Error processing detection {i} with config {config}: {e}")
-                        continue
-                
-                log_debug(f"Config {config}: {valid_detections} valid detections")
+                pages = split_ocr_data_by_page(data, len(valid_indices))
+                for i, page_data in zip(valid_indices, pages):
+                    results[i].extend(process_detections(page_data))
                 
             except Exception as e:
-                log_error(f"OCR error with configuration {config}: {e}")
+                log_error(f"Batch OCR error with configuration {config}: {e}")
                 record_ocr_error()
                 continue
         
-        log_debug(f"Text extraction completed: {len(all_detections)} total detections")
-        return all_detections
+        log_debug("Batch text extraction completed: %d total detections",
+                  sum(len(detections) for detections in results))
+        return results
         
     except Exception as e:
-        log_error(f"Critical error during text extraction: {e}")
+        log_error(f"Critical error during batch text extraction: {e}")
         record_ocr_error()
-        return []
+        return [[] for _ in images]
 
 def calculate_distance(det1, det2):
     """Calculates the Euclidean distance between two detections.
     
+    Threshold checks should use calculate_squared_distance instead; this is
+    only for callers that need the actual distance.
+    
     Args:
         det1 (dict): First detection
         det2 (dict): Second detection
@@ -201,11 +600,163 @@ def calculate_distance(det1, det2):
     except Exception:
         return float('inf')
 
-def deduplicate_detections(detections):
+def calculate_squared_distance(det1, det2):
+    """Calculates the squared Euclidean distance between two detections.
+    
+    Args:
+        det1 (dict): First detection
+        det2 (dict): Second detection
+        
+    Returns:
+        float: Squared Euclidean distance
+    """
+    try:
+        dx = det1['center_x'] - det2['center_x']
+        dy = det1['center_y'] - det2['center_y']
+        return dx * dx + dy * dy
+    except Exception:
+        return float('inf')
+
+def _text_key(det):
+    """Returns the case-insensitive comparison key of a detection's text.
+    
+    Detections built by process_detections carry the key precomputed in
+    '_key'. For detections coming from elsewhere it is derived once and
+    stored on the dict, so later bucketing passes reuse it.
+    
+    Args:
+        det (dict): Detection
+        
+    Returns:
+        str: Case-folded text
+    """
+    key = det.get('_key')
+    if key is None:
+        key = det['_key'] = det['text'].casefold()
+    return key
+
+def _is_valid_detection(det):
+    """Checks that a detection can be safely deduplicated.
+    
+    Args:
+        det: Detection to check
+        
+    Returns:
+        bool: True if the detection is valid
+    """
+    if not isinstance(det, dict):
+        return False
+    
+    if not all(field in det for field in ('text', 'confidence', 'center_x', 'center_y')):
+        return False
+    
+    # Value validation
+    text = det['text']
+    if not isinstance(text, str) or not text or text.isspace():
+        return False
+    
+    confidence = det['confidence']
+    if not isinstance(confidence, (int, float)) or confidence < 0:
+        return False
+    
+    center_x = det['center_x']
+    center_y = det['center_y']
+    if not isinstance(center_x, (int, float)) or not isinstance(center_y, (int, float)):
+        return False
+    
+    return center_x >= 0 and center_y >= 0
+
+@dataclass
+class Detections:
+    """Structure-of-arrays view over a list of detections.
+    
+    Coordinates and confidences are held in contiguous NumPy arrays so that
+    hot loops read plain columns instead of looking up keys in every dict.
+    The original detection dicts are kept in `items` so results can still be
+    returned in the list-of-dicts format used by the rest of the system.
+    """
+    text: list
+    key: list
+    cx: np.ndarray
+    cy: np.ndarray
+    conf: np.ndarray
+    items: list
+    
+    @classmethod
+    def from_list(cls, detections):
+        """Builds the column arrays from a list of detection dicts.
+        
+        Args:
+            detections (list): List of detections
+            
+        Returns:
+            Detections: Structure-of-arrays view of the detections
+        """
+        items = list(detections)
+        return cls(
+            text=[det['text'] for det in items],
+            key=[_text_key(det) for det in items],
+            cx=np.fromiter((det['center_x'] for det in items), dtype=np.float64, count=len(items)),
+            cy=np.fromiter((det['center_y'] for det in items), dtype=np.float64, count=len(items)),
+            conf=np.fromiter((det['confidence'] for det in items), dtype=np.float64, count=len(items)),
+            items=items,
+        )
+    
+    def __len__(self):
+        return len(self.items)
+
+def _trusted_deduplicate(detections):
+    """Removes duplicate detections without validating them first.
+    
+    Used for detections produced by extract_all_text_with_positions, which
+    already guarantees non-empty text and non-negative numeric coordinates.
+    
+    Args:
+        detections (list): List of valid detections to deduplicate
+        
+    Returns:
+        list: List of deduplicated detections
+    """
+    try:
+        columns = Detections.from_list(detections)
+    except Exception as e:
+        log_error(f"Error building detection columns: {e}")
+        return list(detections)
+    
+    # Confidence order (highest first); the stable sort keeps ties in input order
+    order = np.argsort(-columns.conf, kind='stable').tolist()
+    xs = columns.cx.tolist()
+    ys = columns.cy.tolist()
+    keys = columns.key
+    items = columns.items
+    
+    # Deduplication: detections are bucketed by case-folded text and then by a
+    # grid of cell size DEDUPLICATION_DISTANCE_THRESHOLD, so only the 3x3
+    # neighbourhood of cells with identical text has to be compared
+    grids = {}  # text -> DetectionGrid of kept centers
+    deduplicated = []
+    for i in order:
+        cx = xs[i]
+        cy = ys[i]
+        grid = grids.get(keys[i])
+        if grid is None:
+            grid = grids[keys[i]] = DetectionGrid(DEDUPLICATION_DISTANCE_THRESHOLD)
+        
+        if not grid.has_neighbor(cx, cy, _THRESH_SQ):
+            grid.add(cx, cy)
+            deduplicated.append(items[i])
+    
+    log_debug("Deduplication completed: %d unique detections", len(deduplicated))
+    return deduplicated
+
+def deduplicate_detections(detections, validate=False):
     """Removes duplicate detections based on distance and confidence.
     
     Args:
         detections (list): List of detections to deduplicate
+        validate (bool, optional): Whether to filter invalid detections first.
+            Detections from extract_all_text_with_positions are already valid;
+            pass True for detections built elsewhere
         
     Returns:
         list: List of deduplicated detections
@@ -216,90 +767,131 @@ def deduplicate_detections(detections):
             log_debug("Empty or invalid detection list")
             return []
         
-        log_debug(f"Starting deduplication of {len(detections)} detections")
+        log_debug("Starting deduplication of %d detections", len(detections))
+        
+        if not validate:
+            return _trusted_deduplicate(detections)
         
         # Filter invalid detections
-        valid_detections = []
-        for det in detections:
-            try:
-                if not isinstance(det, dict):
-                    continue
-                
-                required_fields = ['text', 'confidence', 'center_x', 'center_y']
-                if not all(field in det for field in required_fields):
-                    continue
-                
-                # Value validation
-                if not det['text'] or det['text'].isspace():
-                    continue
-                
-                if not isinstance(det['confidence'], (int, float)) or det['confidence'] < 0:
-                    continue
-                
-                if not all(isinstance(det[field], (int, float)) for field in ['center_x', 'center_y']):
-                    continue
-                
-                if det['center_x'] < 0 or det['center_y'] < 0:
-                    continue
-                
-                valid_detections.append(det)
-                
-            except Exception as e:
-                log_error(f"Error validating detection: {e}")
-                continue
+        valid_detections = [det for det in detections if _is_valid_detection(det)]
         
         if not valid_detections:
             log_debug("No valid detections after filtering")
             return []
         
-        log_debug(f"Valid detections after filtering: {len(valid_detections)}")
-        
-        # Sort by confidence (highest first)
-        try:
-            valid_detections.sort(key=lambda x: x['confidence'], reverse=True)
-        except Exception as e:
-            log_error(f"Error sorting detections: {e}")
-            return valid_detections  # Return without sorting
-        
-        # Deduplication
-        deduplicated = []
-        for current in valid_detections:
-            try:
-                is_duplicate = False
-                
-                for existing in deduplicated:
-                    try:
-                        # Check if text is identical
-                        if current['text'].lower() == existing['text'].lower():
-                            distance = calculate_distance(current, existing)
-                            if distance < DEDUPLICATION_DISTANCE_THRESHOLD:
-                                is_duplicate = True
-                                break
-                    except Exception as e:
-                        log_error(f"Error comparing detections: {e}")
-                        continue
-                
-                if not is_duplicate:
-                    deduplicated.append(current)
-                    
-            except Exception as e:
-                log_error(f"Error during deduplication: {e}")
-                continue
+        log_debug("Valid detections after filtering: %d", len(valid_detections))
         
-        log_debug(f"Deduplication completed: {len(deduplicated)} unique detections")
-        return deduplicated
+        return _trusted_deduplicate(valid_detections)
         
     except Exception as e:
         log_error(f"Critical error during deduplication: {e}")
         # Fallback: return original detections
         return detections if isinstance(detections, list) else []
 
+# Above this many detections, offsets are computed and searched with NumPy
+NUMPY_OFFSETS_MIN_DETECTIONS = 64
+
+def _detection_start_offsets(texts):
+    """Computes the start offset of each text once joined with single spaces.
+    
+    Small inputs use an array.array to avoid the NumPy setup overhead.
+    
+    Args:
+        texts (list): Detection texts in join order
+        
+    Returns:
+        array.array or numpy.ndarray: Sorted start offsets
+    """
+    if len(texts) > NUMPY_OFFSETS_MIN_DETECTIONS:
+        lengths = np.fromiter((len(text) + 1 for text in texts[:-1]), dtype=np.int64, count=len(texts) - 1)
+        return np.concatenate(([0], np.cumsum(lengths)))
+    
+    # +1 for the space separating detections
+    return array.array('i', itertools.accumulate(
+        (len(text) + 1 for text in texts[:-1]), initial=0
+    ))
+
+def _detections_at_positions(starts, dets_by_idx, positions):
+    """Finds the detections whose text covers each of several full-text positions.
+    
+    All positions are resolved with a single searchsorted call when the
+    offsets are a NumPy array.
+    
+    Args:
+        starts (array.array or numpy.ndarray): Sorted start offsets of the detections
+        dets_by_idx (list): Detections in the same order as starts
+        positions (list): Character positions in the full text
+        
+    Returns:
+        list: Detection covering each position, None where it falls on a separator
+    """
+    if isinstance(starts, np.ndarray):
+        indices = (np.searchsorted(starts, positions, side='right') - 1).tolist()
+    else:
+        indices = [bisect.bisect_right(starts, position) - 1 for position in positions]
+    
+    found = []
+    for k, position in zip(indices, positions):
+        if k < 0 or position >= starts[k] + len(dets_by_idx[k]['text']):
+            found.append(None)
+        else:
+            found.append(dets_by_idx[k])
+    return found
+
+def _end_word_coordinates(pattern_matches, word_patterns, starts, detections):
+    """Maps the end words found inside regex matches to detection centers.
+    
+    Args:
+        pattern_matches (list): Matches of the target pattern in the full text
+        word_patterns (tuple): (end_word, compiled word pattern) pairs
+        starts (array.array or numpy.ndarray): Start offsets of the detections
+        detections (list): Detections in join order
+        
+    Returns:
+        list: List of found coordinates (x, y)
+    """
+    coordinates = []
+    
+    # Absolute position of the last character of every end word in every match
+    end_words = []
+    positions = []
+    for match in pattern_matches:
+        try:
+            # Find all occurrences of target word in the match
+            match_text = match.group()
+            match_start = match.start()
+            
+            # Search for both "to" and "t0" as possible end words
+            for end_word, word_pattern in word_patterns:
+                for word_match in word_pattern.finditer(match_text):
+                    position = match_start + word_match.end() - 1
+                    end_words.append(end_word)
+                    positions.append(position)
+                    
+        except Exception as e:
+            log_error(f"Error processing pattern match: {e}")
+            continue
+    
+    # Map all positions to detections in one lookup
+    if positions:
+        try:
+            found = _detections_at_positions(starts, detections, positions)
+            for end_word, det in zip(end_words, found):
+                if det is not None:
+                    coord = (det['center_x'], det['center_y'])
+                    coordinates.append(coord)
+                    log_debug("Coordinates found for '%s': %s", end_word, coord)
+        except Exception as e:
+            log_error(f"Error extracting word coordinates: {e}")
+    
+    return coordinates
+
 def find_target_pattern_in_detections(detections, target_pattern, target_end_word):
     """Searches for target pattern in detections and finds coordinates of the final word.
     
     Args:
         detections (list): List of detections
-        target_pattern (str): Regex pattern to search for
+        target_pattern (str or re.Pattern): Regex pattern to search for
         target_end_word (str): Final word to find coordinates for
         
     Returns:
@@ -311,70 +903,24 @@ def find_target_pattern_in_detections(detections, target_pattern, target_end_wor
         if not detections:
             return coordinates
         
-        log_debug(f"Searching pattern '{target_pattern}' in {len(detections)} detections")
+        log_debug("Searching pattern '%s' in %d detections", target_pattern, len(detections))
         
-        # Create a string with all detected text
-        all_text_parts = []
-        text_to_detection = {}  # Map text position -> detection
+        # Create a string with all detected text, separated by spaces
+        texts = [det['text'] for det in detections]
+        full_text = ' '.join(texts)
         
-        current_pos = 0
-        for det in detections:
-            try:
-                text = det['text']
-                all_text_parts.append(text)
-                
-                # Map each character to its detection
-                for i in range(len(text)):
-                    text_to_detection[current_pos + i] = det
-                
-                current_pos += len(text) + 1  # +1 for space
-                all_text_parts.append(' ')  # Add space between detections
-                
-            except Exception as e:
-                log_error(f"Error processing detection for pattern: {e}")
-                continue
-        
-        full_text = ''.join(all_text_parts)
-        log_debug(f"Full text for search: '{full_text[:100]}...'")
+        # Start offset of each detection in the full text
+        starts = _detection_start_offsets(texts)
+        log_debug("Full text for search: '%s...'", full_text[:100])
         
         # Search for the pattern
         try:
-            pattern_matches = list(re.finditer(target_pattern, full_text, re.IGNORECASE))
-            log_debug(f"Found {len(pattern_matches)} pattern matches")
+            compiled_pattern, word_patterns = _compile_patterns(target_pattern)
+            pattern_matches = list(compiled_pattern.finditer(full_text))
+            log_debug("Found %d pattern matches", len(pattern_matches))
+            
+            coordinates.extend(_end_word_coordinates(pattern_matches, word_patterns, starts, detections))
             
-            for match in pattern_matches:
-                try:
-                    # Find all occurrences of target word in the match
-                    match_text = match.group()
-                    
-                    # Search for both "to" and "t0" as possible end words
-                    end_words = ['to', 't0']
-                    
-                    for end_word in end_words:
-                        word_pattern = r'\b' + re.escape(end_word) + r'\b'
-                        word_matches = list(re.finditer(word_pattern, match_text, re.IGNORECASE))
-                        
-                        for word_match in word_matches:
-                            try:
-                                # Calculate absolute position of the word
-                                word_start_pos = match.start() + word_match.start()
-                                word_end_pos = match.start() + word_match.end() - 1
-                                
-                                # Find detection corresponding to end of word
-                                if word_end_pos in text_to_detection:
-                                    det = text_to_detection[word_end_pos]
-                                    coord = (det['center_x'], det['center_y'])
-                                    coordinates.append(coord)
-                                    log_debug(f"Coordinates found for '{end_word}': {coord}")
-                                
-                            except Exception as e:
-                                log_error(f"Error extracting word coordinates: {e}")
-                                continue
-                            
-                except Exception as e:
-                    log_error(f"Error processing pattern match: {e}")
-                    continue
-                    
         except Exception as e:
             log_error(f"Error searching regex pattern: {e}")
         
@@ -383,31 +929,51 @@ def find_target_pattern_in_detections(detections, target_pattern, target_end_wor
             log_debug("No coordinates found with pattern matching, trying direct word search")
             try:
                 # Look for "Continue" followed by "to" or "t0" in nearby detections
-                continue_detections = [det for det in detections if 'continue' in det['text'].lower()]
+                keys = [_text_key(det) for det in detections]
+                continue_detections = [det for det, key in zip(detections, keys) if 'continue' in key]
+                end_word_detections = [det for det, key in zip(detections, keys) if key in END_WORDS]
                 
                 for continue_det in continue_detections:
                     # Find detections near "Continue" that contain "to" or "t0"
-                    for det in detections:
-                        if det['text'].lower() in ['to', 't0']:
-                            # Check if this detection is reasonably close to Continue
-                            distance = ((det['center_x'] - continue_det['center_x'])**2 + 
-                                      (det['center_y'] - continue_det['center_y'])**2)**0.5
-                            
-                            if distance < 200:  # Within 200 pixels
-                                coord = (det['center_x'], det['center_y'])
-                                coordinates.append(coord)
-                                log_debug(f"Direct search found '{det['text']}' near Continue: {coord}")
+                    for det in end_word_detections:
+                        # Check if this detection is reasonably close to Continue
+                        distance_sq = calculate_squared_distance(det, continue_det)
+                        
+                        if distance_sq < _DIRECT_SEARCH_RADIUS_SQ:
+                            coord = (det['center_x'], det['center_y'])
+                            coordinates.append(coord)
+                            log_debug("Direct search found '%s' near Continue: %s", det['text'], coord)
                                 
             except Exception as e:
                 log_error(f"Error in direct word search: {e}")
         
-        log_debug(f"Pattern search completed: {len(coordinates)} coordinates found")
+        log_debug("Pattern search completed: %d coordinates found", len(coordinates))
         return coordinates
         
     except Exception as e:
         log_error(f"Critical error during pattern search: {e}")
         return []
 
+def _grid_deduplicate_coordinates(coordinates, tolerance, tolerance_sq):
+    """Greedy coordinate deduplication using a spatial hash grid.
+    
+    Args:
+        coordinates (list): Valid (x, y) coordinates in priority order
+        tolerance (float): Tolerance for considering coordinates as duplicates
+        tolerance_sq (float): Squared tolerance
+        
+    Returns:
+        list: List of deduplicated coordinates
+    """
+    grid = DetectionGrid(tolerance)
+    deduplicated = []
+    for x, y in coordinates:
+        if not grid.has_neighbor(x, y, tolerance_sq, inclusive=True):
+            kept = (int(x), int(y))
+            grid.add(*kept)
+            deduplicated.append(kept)
+    return deduplicated
+
 def deduplicate_coordinates(coordinates, tolerance=None):
     """Final deduplication of found coordinates.
     
@@ -420,42 +986,68 @@ def deduplicate_coordinates(coordinates, tolerance=None):
     """
     if tolerance is None:
         tolerance = FINAL_COORDINATES_TOLERANCE
+        tolerance_sq = _TOL_SQ
+    else:
+        tolerance_sq = tolerance * tolerance
     
     try:
         if not coordinates:
             return []
         
-        log_debug(f"Deduplicating {len(coordinates)} coordinates with tolerance {tolerance}")
+        log_debug("Deduplicating %d coordinates with tolerance %s", len(coordinates), tolerance)
         
-        deduplicated = []
+        valid = []
         for coord in coordinates:
-            try:
-                if not isinstance(coord, (tuple, list)) or len(coord) != 2:
-                    continue
-                
-                x, y = coord
-                if not all(isinstance(val, (int, float)) for val in [x, y]):
-                    continue
-                
-                is_duplicate = False
-                for existing_coord in deduplicated:
-                    try:
-                        ex_x, ex_y = existing_coord
-                        distance = ((x - ex_x) ** 2 + (y - ex_y) ** 2) ** 0.5
-                        if distance <= tolerance:
-                            is_duplicate = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not is_duplicate:
-                    deduplicated.append((int(x), int(y)))
-                    
-            except Exception as e:
-                log_error(f"Error deduplicating coordinate {coord}: {e}")
+            if not isinstance(coord, (tuple, list)) or len(coord) != 2:
+                continue
+            if not all(isinstance(val, (int, float)) for val in coord):
                 continue
+            valid.append(coord)
+        
+        if not valid:
+            return []
+        
+        raw = np.asarray(valid, dtype=np.float64)
+        kept = np.trunc(raw)
+        keep = np.ones(len(valid), dtype=bool)
+        
+        if cKDTree is not None and len(valid) > KDTREE_MIN_COORDINATES:
+            # Radius queries against a KD-tree avoid building an NxN matrix;
+            # kept coordinates (truncated to int) drop the later ones they cover
+            tree = cKDTree(raw)
+            for i in range(len(valid)):
+                if keep[i]:
+                    neighbours = np.asarray(tree.query_ball_point(kept[i], r=tolerance), dtype=np.intp)
+                    keep[neighbours[neighbours > i]] = False
+        elif len(valid) > KDTREE_MIN_COORDINATES:
+            # Without SciPy, large inputs use a spatial hash with cell size equal
+            # to the tolerance: only the 3x3 neighbourhood of a cell is checked
+            keep = None
+        elif njit is not None:
+            # Compiled loop: same greedy pass in O(N) memory
+            keep = _greedy_keep_kernel(
+                np.ascontiguousarray(raw[:, 0]), np.ascontiguousarray(raw[:, 1]),
+                np.ascontiguousarray(kept[:, 0]), np.ascontiguousarray(kept[:, 1]),
+                float(tolerance_sq)
+            )
+        else:
+            # Pairwise squared distances in one broadcast: row i is a kept
+            # coordinate (stored truncated to int), column j a later candidate
+            dx = raw[None, :, 0] - kept[:, None, 0]
+            dy = raw[None, :, 1] - kept[:, None, 1]
+            dup = (dx * dx + dy * dy) <= tolerance_sq
+            
+            # Greedy walk in input order: each kept coordinate drops the later ones it covers
+            for i in range(len(valid)):
+                if keep[i]:
+                    keep[i + 1:] &= ~dup[i, i + 1:]
+        
+        if keep is None:
+            deduplicated = _grid_deduplicate_coordinates(valid, tolerance, tolerance_sq)
+        else:
+            deduplicated = [(int(x), int(y)) for x, y in kept[keep].tolist()]
         
-        log_debug(f"Coordinate deduplication completed: {len(deduplicated)} unique coordinates")
+        log_debug("Coordinate deduplication completed: %d unique coordinates", len(deduplicated))
         return deduplicated
         
     except Exception as e:
@@ -6,40 +6,304 @@ This module orchestrates all system components to:
 - Search for target message
 - Execute automatic clicks when necessary"""
 
+import re
 import time
-from datetime import datetime
+import queue
+import atexit
+import random
+import hashlib
+import functools
+import itertools
+import threading
+from collections import Counter, OrderedDict
 
 from config import (
     TARGET_PATTERN, TARGET_END_WORD, SCREENSHOT_FULLSCREEN_PATTERN,
-    MAX_RETRIES, RETRY_DELAY, MAX_CONSECUTIVE_FAILURES, EXTENDED_WAIT_TIME
+    MAX_RETRIES, RETRY_DELAY, RETRY_BACKOFF_FACTOR, RETRY_JITTER,
+    MAX_CONSECUTIVE_FAILURES, EXTENDED_WAIT_TIME,
+    ADAPTIVE_VARIANTS_WARMUP, ADAPTIVE_VARIANTS_MIN_SCORE,
+    ADAPTIVE_VARIANTS_EXPLORATION, ADAPTIVE_VARIANTS_FALLBACK_MISSES
 )
 from logger import (
     log_message, log_error, log_debug, log_scan_start, log_scan_complete,
     log_enhancement_stats, update_scan_stats, update_performance_stats,
     record_successful_detection, should_log_status_report, log_system_status,
     reset_consecutive_failures, log_extended_wait_start, log_extended_wait_complete,
-    get_stats_copy
+    get_stat, guarded, is_debug_enabled
 )
-from image_processing import (
-    manage_screenshots_folder, safe_screenshot, save_screenshot,
-    enhance_image_for_text_detection, save_enhanced_image
-)
-from ocr_engine import (
-    extract_all_text_with_positions, deduplicate_detections,
-    find_target_pattern_in_detections, deduplicate_coordinates
-)
-from coordinate_manager import perform_automatic_click
-from statistics_manager import get_stats_manager
+
+# image_processing, ocr_engine, coordinate_manager and statistics_manager pull in
+# OpenCV, NumPy, Tesseract bindings and a monitoring thread: they are imported
+# where first needed, so tools that only query scan state stay lightweight
+
+# OCR results cache: (method_name, image digest) -> detections.
+# Consecutive scans of an idle screen produce identical images, so OCR can be skipped.
+_OCR_CACHE = OrderedDict()
+_OCR_CACHE_MAX = 32
+
+# Digest of the last fully processed screenshot and the coordinates it produced
+_last_screen = {'digest': None, 'coordinates': []}
+
+# Debug images are written by a background thread so PNG encoding stays off the scan path
+_IO_QUEUE = queue.Queue(maxsize=16)
+_io_thread = None
+_io_thread_lock = threading.Lock()
+
+def _io_worker():
+    """Runs queued save jobs until the shutdown sentinel (None) is received."""
+    while True:
+        job = _IO_QUEUE.get()
+        try:
+            if job is None:
+                return
+            func, args = job
+            func(*args)
+        except Exception as e:
+            log_error(f"Error in background save: {e}")
+        finally:
+            _IO_QUEUE.task_done()
+
+@guarded()
+def save_in_background(func, *args):
+    """Queues a debug save job for the background I/O thread.
+    
+    When the queue is full the oldest pending job is dropped: the images are
+    only kept for debugging.
+    
+    Args:
+        func (callable): Save function, e.g. save_screenshot
+        *args: Arguments for the save function
+    """
+    global _io_thread
+    with _io_thread_lock:
+        if _io_thread is None or not _io_thread.is_alive():
+            _io_thread = threading.Thread(target=_io_worker, name="screenshot-io", daemon=True)
+            _io_thread.start()
+    
+    while True:
+        try:
+            _IO_QUEUE.put_nowait((func, args))
+            return
+        except queue.Full:
+            try:
+                _IO_QUEUE.get_nowait()
+                _IO_QUEUE.task_done()
+            except queue.Empty:
+                pass
+
+def _drain_io_queue():
+    """Lets pending debug saves finish on interpreter shutdown."""
+    if _io_thread is not None and _io_thread.is_alive():
+        try:
+            _IO_QUEUE.put(None, timeout=1)
+            _io_thread.join(timeout=5)
+        except Exception:
+            pass
+
+atexit.register(_drain_io_queue)
+
+# Adaptive variant selection: contributions of each enhancement method to found
+# coordinates, number of successful scans and current streak of scans without a hit
+_METHOD_SCORES = Counter()
+_variant_state = {'successful_scans': 0, 'consecutive_misses': 0}
+
+def select_enhancement_variants(enhanced_images):
+    """Chooses which enhancement variants to run OCR on for this scan.
+    
+    All variants run until ADAPTIVE_VARIANTS_WARMUP successful scans have been
+    recorded, and again after ADAPTIVE_VARIANTS_FALLBACK_MISSES consecutive
+    scans without a hit. Otherwise only variants that contributed to earlier
+    detections run, plus a random share of the others for exploration.
+    Callers must not cache a pruned scan's result as the answer for its
+    screen: a miss there may only mean the right variant was skipped.
+    
+    Args:
+        enhanced_images (list): List of (method_name, PIL.Image) tuples
+        
+    Returns:
+        list: Selected (method_name, PIL.Image) tuples
+    """
+    if (_variant_state['successful_scans'] < ADAPTIVE_VARIANTS_WARMUP
+            or _variant_state['consecutive_misses'] >= ADAPTIVE_VARIANTS_FALLBACK_MISSES):
+        return list(enhanced_images)
+    
+    selected = [
+        (method_name, image) for method_name, image in enhanced_images
+        if _METHOD_SCORES[method_name] >= ADAPTIVE_VARIANTS_MIN_SCORE
+        or random.random() < ADAPTIVE_VARIANTS_EXPLORATION
+    ]
+    log_debug("Adaptive variants: running %d/%d", len(selected), len(enhanced_images))
+    return selected
+
+@guarded()
+def record_variant_results(variant_detections, coordinates):
+    """Credits the enhancement methods whose detections produced the found coordinates.
+    
+    Args:
+        variant_detections (list): List of (method_name, detections) tuples
+        coordinates (list): Final coordinates found by the scan
+    """
+    if not coordinates:
+        _variant_state['consecutive_misses'] += 1
+        return
+    
+    _variant_state['consecutive_misses'] = 0
+    _variant_state['successful_scans'] += 1
+    hits = set(coordinates)
+    for method_name, detections in variant_detections:
+        if any((det['center_x'], det['center_y']) in hits for det in detections):
+            _METHOD_SCORES[method_name] += 1
+
+@functools.lru_cache(maxsize=1)
+def _end_word_regex():
+    """Compiles the substring prefilter for the end words, matched case-insensitively.
+    
+    Returns:
+        re.Pattern: Alternation of all end words
+    """
+    from ocr_engine import END_WORDS
+    return re.compile('|'.join(re.escape(end_word) for end_word in END_WORDS), re.IGNORECASE)
+
+@guarded(fallback=True)
+def has_end_word(detections):
+    """Checks whether any detection text contains one of the end words.
+    
+    The pattern search can only return coordinates for detections containing
+    an end word, so a negative answer lets the scan skip it entirely. All
+    texts are joined with a record separator and scanned by one compiled
+    regex instead of a Python-level loop over the detections.
+    
+    Args:
+        detections (list): List of detections
+        
+    Returns:
+        bool: True if at least one detection contains an end word (also on error,
+            so the full search still runs)
+    """
+    return _end_word_regex().search('\x1e'.join([det['text'] for det in detections])) is not None
+
+@guarded()
+def image_digest(image):
+    """Computes a content digest of an image.
+    
+    Args:
+        image (PIL.Image): Image to hash
+        
+    Returns:
+        bytes or None: Digest of the image size, mode and pixel data, None on error
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{image.mode}:{image.width}x{image.height}".encode())
+    hasher.update(image.tobytes())
+    return hasher.digest()
+
+def screen_unchanged_since_last_scan():
+    """Checks whether the screen is identical to the last fully processed screenshot.
+    
+    Returns:
+        bool: True if a new screenshot has the same content digest
+    """
+    if _last_screen['digest'] is None:
+        return False
+    from image_processing import safe_screenshot
+    screenshot = safe_screenshot()
+    if screenshot is None:
+        return False
+    return image_digest(screenshot) == _last_screen['digest']
+
+def retry_delay_for_attempt(retry_delay, attempt):
+    """Computes the wait before the next attempt with exponential backoff and jitter.
+    
+    Args:
+        retry_delay (float): Base delay in seconds
+        attempt (int): Index of the attempt that just failed (0-based)
+        
+    Returns:
+        float: Delay in seconds
+    """
+    delay = retry_delay * (RETRY_BACKOFF_FACTOR ** attempt)
+    return delay + random.uniform(0, delay * RETRY_JITTER)
+
+@guarded(fallback=())
+def extract_variants_cached(variants, digests=None):
+    """Extracts text detections from several image variants, reusing cached results.
+    
+    Variants whose content was already processed are served from the cache;
+    all the others are sent to OCR together in one batch. Variants whose
+    digest cannot be computed bypass the cache.
+    
+    Args:
+        variants (list): List of (method_name, PIL.Image) tuples
+        digests (dict, optional): Precomputed digests by method name
+        
+    Returns:
+        list: List of (method_name, detections) tuples in input order, empty on error
+    """
+    digests = digests or {}
+    keys = [
+        (method_name, digests.get(method_name) or image_digest(image))
+        for method_name, image in variants
+    ]
+    
+    # Results by variant index; a None digest would make unrelated images share a key
+    results = [None] * len(variants)
+    misses = []
+    for index, (key, (method_name, image)) in enumerate(zip(keys, variants)):
+        cached = _OCR_CACHE.get(key) if key[1] is not None else None
+        if cached is not None:
+            _OCR_CACHE.move_to_end(key)
+            log_debug("OCR cache hit for %s", method_name)
+            results[index] = list(cached)
+        else:
+            misses.append((index, key, image))
+    
+    if misses:
+        from ocr_engine import extract_all_text_with_positions_batch
+        batched = extract_all_text_with_positions_batch([image for _, _, image in misses])
+        for (index, key, _), detections in zip(misses, batched):
+            results[index] = detections
+            if key[1] is None:
+                continue
+            _OCR_CACHE[key] = tuple(detections)
+            if len(_OCR_CACHE) > _OCR_CACHE_MAX:
+                _OCR_CACHE.popitem(last=False)
+    
+    return [(method_name, detections) for (method_name, _), detections in zip(variants, results)]
+
+@guarded()
+def set_scan_activity(controller, activity, details):
+    """Reports the current scan step to the system controller, if there is one.
+    
+    Args:
+        controller (SystemController or None): System controller
+        activity (str): Current activity
+        details (str): Activity details
+    """
+    if controller:
+        controller.set_current_activity(activity, details)
 
 def scan_entire_screen_for_continue_message():
     """Executes a complete screen scan to find the 'Continue' message.
     
+    The helpers called here handle their own errors (internally or through
+    @guarded) and return safe fallbacks, so a single try/except covers the
+    whole scan.
+    
     Returns:
         list: List of found coordinates or empty list if not found/error
     """
     try:
         log_debug("Starting complete screen scan")
         
+        from image_processing import (
+            manage_screenshots_folder, safe_screenshot, save_screenshot,
+            enhance_image_for_text_detection, save_enhanced_image
+        )
+        from ocr_engine import (
+            deduplicate_detections, find_target_pattern_in_detections,
+            deduplicate_coordinates
+        )
+        
         # Get system controller to update activity
         try:
             from system_controller import get_system_controller
@@ -48,134 +312,98 @@ def scan_entire_screen_for_continue_message():
             controller = None
         
         # Manage screenshot folder
-        try:
-            if controller:
-                controller.set_current_activity("Taking screenshot", "Preparing screenshot folder")
-            manage_screenshots_folder()
-        except Exception as e:
-            log_error(f"Error managing screenshot folder: {e}")
-            # Continue anyway
+        set_scan_activity(controller, "Taking screenshot", "Preparing screenshot folder")
+        manage_screenshots_folder()
         
         # Capture screenshot
-        try:
-            if controller:
-                controller.set_current_activity("Taking screenshot", "Capturing screen")
-            screenshot = safe_screenshot()
-            if screenshot is None:
-                log_error("Unable to capture screenshot")
-                return []
-        except Exception as e:
-            log_error(f"Critical error during screenshot capture: {e}")
+        set_scan_activity(controller, "Taking screenshot", "Capturing screen")
+        screenshot = safe_screenshot()
+        if screenshot is None:
+            log_error("Unable to capture screenshot")
             return []
         
-        # Save screenshot for debug
-        try:
-            save_screenshot(screenshot, SCREENSHOT_FULLSCREEN_PATTERN)
-        except Exception as e:
-            log_error(f"Error saving screenshot: {e}")
-            # Continue anyway
+        # Save screenshot for debug (in the background)
+        save_in_background(save_screenshot, screenshot, SCREENSHOT_FULLSCREEN_PATTERN)
+        
+        # Unchanged screen: enhancement and OCR would give the same result again
+        screen_digest = image_digest(screenshot)
+        if screen_digest is not None and screen_digest == _last_screen['digest']:
+            log_debug("Screen unchanged since last scan, reusing previous result")
+            return list(_last_screen['coordinates'])
         
         # Image enhancement
-        try:
-            if controller:
-                controller.set_current_activity("Processing image", "Enhancing image for OCR")
-            enhanced_images = enhance_image_for_text_detection(screenshot)
-            if not enhanced_images:
-                log_error("No enhanced images generated")
-                return []
-        except Exception as e:
-            log_error(f"Error during image enhancement: {e}")
+        set_scan_activity(controller, "Processing image", "Enhancing image for OCR")
+        enhanced_images = enhance_image_for_text_detection(screenshot)
+        if not enhanced_images:
+            log_error("No enhanced images generated")
             return []
         
-        # Process original image first
-        all_detections = []
-        try:
-            if controller:
-                controller.set_current_activity("Running OCR", "Processing original image")
-            log_debug("Processing original image")
-            original_detections = extract_all_text_with_positions(screenshot)
-            if original_detections:
-                all_detections.extend(original_detections)
-                log_enhancement_stats("ORIGINAL", len(original_detections))
+        # Skip variants that have not been contributing to detections
+        variant_count = len(enhanced_images)
+        enhanced_images = select_enhancement_variants(enhanced_images)
+        all_variants_ran = len(enhanced_images) == variant_count
+        
+        # Save enhanced images for debug (in the background)
+        for method_name, enhanced_image in enhanced_images:
+            save_in_background(save_enhanced_image, enhanced_image, method_name)
+        
+        # OCR the original and all enhanced images in one batch: Tesseract is
+        # started once per configuration for all of them, not once per image
+        set_scan_activity(controller, "Running OCR", f"Processing original and {len(enhanced_images)} enhanced images")
+        variants = [("ORIGINAL", screenshot)] + list(enhanced_images)
+        digests = {"ORIGINAL": screen_digest} if screen_digest is not None else None
+        variant_detections = extract_variants_cached(variants, digests)
+        
+        for method_name, detections in variant_detections:
+            if detections:
+                log_enhancement_stats(method_name, len(detections))
             else:
-                log_debug("No detections for original image")
-        except Exception as e:
-            log_error(f"Error extracting text from original image: {e}")
+                log_debug("No detections for method %s", method_name)
         
-        # Process each enhanced image
-        for i, (method_name, enhanced_image) in enumerate(enhanced_images):
-            try:
-                if controller:
-                    controller.set_current_activity("Running OCR", f"Processing enhanced image {i+1}/{len(enhanced_images)} ({method_name})")
-                log_debug(f"Processing enhanced image: {method_name}")
-                
-                # Save enhanced image for debug
-                try:
-                    save_enhanced_image(enhanced_image, method_name)
-                except Exception as e:
-                    log_error(f"Error saving enhanced image {method_name}: {e}")
-                    # Continue anyway
-                
-                # Extract text
-                try:
-                    detections = extract_all_text_with_positions(enhanced_image)
-                    if detections:
-                        all_detections.extend(detections)
-                        log_enhancement_stats(method_name, len(detections))
-                    else:
-                        log_debug(f"No detections for method {method_name}")
-                except Exception as e:
-                    log_error(f"Error extracting text for {method_name}: {e}")
-                    continue
-                
-            except Exception as e:
-                log_error(f"Error processing method {method_name}: {e}")
-                continue
+        # Concatenate all variants at once instead of growing the list per variant
+        all_detections = list(itertools.chain.from_iterable(
+            detections for _, detections in variant_detections
+        ))
         
         if not all_detections:
             log_debug("No detections found in all enhanced images")
+            record_variant_results(variant_detections, [])
             return []
         
-        # Deduplicate detections
-        try:
-            if controller:
-                controller.set_current_activity("Processing results", "Deduplicating text detections")
-            unique_detections = deduplicate_detections(all_detections)
-            log_debug(f"Detections after deduplication: {len(unique_detections)}")
-        except Exception as e:
-            log_error(f"Error deduplicating detections: {e}")
-            unique_detections = all_detections  # Fallback
+        # Deduplicate detections (returns the input unchanged on error)
+        set_scan_activity(controller, "Processing results", "Deduplicating text detections")
+        unique_detections = deduplicate_detections(all_detections)
+        log_debug("Detections after deduplication: %d", len(unique_detections))
         
         # Log found detections (debug only)
-        try:
+        if is_debug_enabled():
             detected_words = [det['text'] for det in unique_detections[:10]]  # First 10
             if detected_words:
-                log_debug(f"Detected words (first 10): {', '.join(detected_words)}")
-        except Exception as e:
-            log_error(f"Error logging detections: {e}")
+                log_debug("Detected words (first 10): %s", ', '.join(detected_words))
         
-        # Search for target pattern
-        try:
-            if controller:
-                controller.set_current_activity("Processing results", "Searching for target pattern")
+        # Search for target pattern (returns an empty list on error)
+        set_scan_activity(controller, "Processing results", "Searching for target pattern")
+        # Every match ends on an end word: skip the search when no detection contains one
+        if has_end_word(unique_detections):
             coordinates = find_target_pattern_in_detections(
                 unique_detections, TARGET_PATTERN, TARGET_END_WORD
             )
-            log_debug(f"Coordinates found by pattern: {len(coordinates)}")
-        except Exception as e:
-            log_error(f"Error searching target pattern: {e}")
-            return []
-        
-        # Final coordinate deduplication
-        try:
-            if controller:
-                controller.set_current_activity("Processing results", "Finalizing coordinates")
-            final_coordinates = deduplicate_coordinates(coordinates)
-            log_debug(f"Final coordinates after deduplication: {len(final_coordinates)}")
-            return final_coordinates
-        except Exception as e:
-            log_error(f"Error deduplicating final coordinates: {e}")
-            return coordinates if coordinates else []
+        else:
+            log_debug("Fast path: no end word in detections, skipping pattern search")
+            coordinates = []
+        log_debug("Coordinates found by pattern: %d", len(coordinates))
+        
+        # Final coordinate deduplication (returns the input unchanged on error)
+        set_scan_activity(controller, "Processing results", "Finalizing coordinates")
+        final_coordinates = deduplicate_coordinates(coordinates)
+        log_debug("Final coordinates after deduplication: %d", len(final_coordinates))
+        # Only a scan over every variant is final for this screen; a pruned
+        # scan is repeated so its misses reach the full-variant fallback
+        if all_variants_ran:
+            _last_screen['digest'] = screen_digest
+            _last_screen['coordinates'] = list(final_coordinates)
+        record_variant_results(variant_detections, final_coordinates)
+        return final_coordinates
         
     except Exception as e:
         log_error(f"Critical error during screen scan: {e}")
@@ -224,6 +452,7 @@ def perform_single_scan(scan_number):
         
         # Update statistics manager
         try:
+            from statistics_manager import get_stats_manager
             stats_manager = get_stats_manager()
             stats_manager.record_scan(
                 scan_number=scan_number,
@@ -263,11 +492,19 @@ def perform_scan_with_retry(scan_number, max_retries=None, retry_delay=None):
     if retry_delay is None:
         retry_delay = RETRY_DELAY
     
+    # Bound once: the loop runs for every failed scan
+    sleep = time.sleep
+    debug = log_debug
+    
     try:
         for attempt in range(max_retries + 1):
             try:
                 if attempt > 0:
-                    log_debug(f"Retry scan #{scan_number}, attempt {attempt + 1}/{max_retries + 1}")
+                    # Same screen as the failed attempt: a full retry cannot succeed
+                    if screen_unchanged_since_last_scan():
+                        debug("Screen unchanged, skipping remaining retries of scan #%s", scan_number)
+                        break
+                    debug("Retry scan #%s, attempt %d/%d", scan_number, attempt + 1, max_retries + 1)
                 
                 success, coordinates = perform_single_scan(scan_number)
                 
@@ -278,16 +515,17 @@ def perform_scan_with_retry(scan_number, max_retries=None, retry_delay=None):
                 
                 # If not the last attempt, wait before retry
                 if attempt < max_retries:
-                    log_debug(f"Scan failed, retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    delay = retry_delay_for_attempt(retry_delay, attempt)
+                    debug("Scan failed, retrying in %.1f seconds...", delay)
+                    sleep(delay)
                 
             except Exception as e:
                 log_error(f"Error during attempt {attempt + 1} of scan #{scan_number}: {e}")
                 if attempt < max_retries:
-                    time.sleep(retry_delay)
+                    sleep(retry_delay_for_attempt(retry_delay, attempt))
                 continue
         
-        log_debug(f"All scan attempts #{scan_number} failed")
+        debug("All scan attempts #%s failed", scan_number)
         return False, []
         
     except Exception as e:
@@ -310,10 +548,12 @@ def handle_scan_result(scan_number, success, coordinates):
             log_message(f"🎯 Target message found in scan #{scan_number}!")
             
             # Execute automatic click
+            from coordinate_manager import perform_automatic_click
             click_success = perform_automatic_click(coordinates)
             
             # Update statistics manager for click
             try:
+                from statistics_manager import get_stats_manager
                 stats_manager = get_stats_manager()
                 stats_manager.record_click(coordinates[0] if coordinates else None, success=click_success)
             except Exception as e:
@@ -326,7 +566,7 @@ def handle_scan_result(scan_number, success, coordinates):
                 log_error(f"❌ Automatic click failed for scan #{scan_number}")
                 return False
         else:
-            log_debug(f"Target message not found in scan #{scan_number}")
+            log_debug("Target message not found in scan #%d", scan_number)
             return False
             
     except Exception as e:
@@ -340,8 +580,7 @@ def handle_consecutive_failures():
         bool: True if an extended wait was performed
     """
     try:
-        stats = get_stats_copy()
-        consecutive_failures = stats.get('consecutive_failures', 0)
+        consecutive_failures = get_stat('consecutive_failures', 0)
         
         if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
             log_extended_wait_start()
@@ -372,13 +611,12 @@ def should_perform_extended_wait():
         bool: True if an extended wait should be performed
     """
     try:
-        stats = get_stats_copy()
-        consecutive_failures = stats.get('consecutive_failures', 0)
+        consecutive_failures = get_stat('consecutive_failures', 0)
         return consecutive_failures >= MAX_CONSECUTIVE_FAILURES
     except Exception:
         return False
 
-def log_scan_summary(scan_number, success, click_performed, scan_time=None):
+def log_scan_summary(scan_number, success, click_performed, scan_time=None, report_status=True):
     """Logs a scan summary.
     
     Args:
@@ -386,6 +624,8 @@ def log_scan_summary(scan_number, success, click_performed, scan_time=None):
         success (bool): Whether the scan was successful
         click_performed (bool): Whether a click was performed
         scan_time (float, optional): Scan time in seconds
+        report_status (bool, optional): Whether to also log a due status report;
+            callers that schedule status reports themselves pass False
     """
     try:
         status_icon = "✅" if success else "❌"
@@ -406,7 +646,7 @@ def log_scan_summary(scan_number, success, click_performed, scan_time=None):
         log_message(summary)
         
         # Log status report if necessary
-        if should_log_status_report():
+        if report_status and should_log_status_report():
             log_system_status()
             
     except Exception as e:
@@ -419,8 +659,7 @@ def get_next_scan_number():
         int: Next scan number
     """
     try:
-        stats = get_stats_copy()
-        return stats.get('total_scans', 0) + 1
+        return get_stat('total_scans', 0) + 1
     except Exception:
         return 1
 
@@ -431,11 +670,9 @@ def is_system_healthy():
         bool: True if the system is healthy
     """
     try:
-        stats = get_stats_copy()
-        
         # Check if there are too many errors
-        total_errors = stats.get('total_errors', 0)
-        total_scans = stats.get('total_scans', 1)
+        total_errors = get_stat('total_errors', 0)
+        total_scans = get_stat('total_scans', 1)
         
         error_rate = total_errors / total_scans if total_scans > 0 else 0
         
@@ -22,10 +22,13 @@ Version: 1.0.0
 import time
 import json
 import threading
-from datetime import datetime, timedelta
-from collections import deque, defaultdict
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any, Tuple
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import islice, takewhile
+from collections import Counter, deque, namedtuple
+from dataclasses import dataclass, fields
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Tuple
+import numpy as np
 import psutil
 import os
 
@@ -48,6 +51,10 @@ class ScanMetrics:
     confidence_score: Optional[float] = None
     error_message: Optional[str] = None
 
+# Compact entry of StatisticsManager.recent_errors; converted to a dict
+# only when the stats are serialized
+ErrorRecord = namedtuple('ErrorRecord', 'timestamp scan_number error')
+
 @dataclass
 class SystemHealth:
     """System health metrics snapshot"""
@@ -61,9 +68,217 @@ class SystemHealth:
     uptime: float
     temperature: Optional[float] = None
 
+def _compile_dict_builder(record_type) -> Callable[..., Dict]:
+    """
+    Generate a function building a dict from a dataclass's field values
+    
+    The generated function takes the fields positionally and returns a dict
+    literal, so no field list is looked up or zipped per record.
+    
+    Args:
+        record_type: Flat dataclass whose fields become the dict keys
+    
+    Returns:
+        Function mapping the field values, in declaration order, to a dict
+    """
+    names = [field.name for field in fields(record_type)]
+    items = ', '.join(f"'{name}': {name}" for name in names)
+    source = f"lambda {', '.join(names)}: {{{items}}}"
+    return eval(compile(source, f'<{record_type.__name__} dict builder>', 'eval'))
+
+# Builds a scan dict from one row of ScanHistory columns
+_scan_dict = _compile_dict_builder(ScanMetrics)
+
+def _record_dicts(records, cutoff_time: Optional[float] = None) -> List[Dict]:
+    """
+    Convert history records to plain dicts
+    
+    The records are flat dataclasses, so a shallow copy of their __dict__ is
+    equivalent to dataclasses.asdict() without its recursive deep copy.
+    History is appended in time order, so when a cutoff is given the deque
+    is walked from the newest end and the walk stops at the first older
+    record.
+    
+    Args:
+        records: Deque of flat dataclass records such as SystemHealth
+        cutoff_time: Oldest timestamp to include, or None for all records
+    
+    Returns:
+        List of record dicts, oldest first
+    """
+    if cutoff_time is None:
+        return [vars(record).copy() for record in records]
+    recent = takewhile(lambda record: record.timestamp >= cutoff_time, reversed(records))
+    return [vars(record).copy() for record in recent][::-1]
+
+class ScanHistory:
+    """
+    Fixed-capacity scan history stored as one NumPy array per field
+    
+    The arrays are twice the capacity long. Records are written after the
+    newest one and, once the end of the arrays is reached, the retained
+    records are moved back to the front. The history is therefore always
+    the contiguous slice [_lo:_hi] in time order, so column views, timestamp
+    searches and reductions need neither a copy nor wraparound handling.
+    """
+    
+    # (field, dtype) in ScanMetrics order; a NaN confidence means None
+    _COLUMNS = (
+        ('timestamp', np.float64),
+        ('scan_number', np.int64),
+        ('duration', np.float64),
+        ('success', np.bool_),
+        ('coordinates_found', np.int64),
+        ('cpu_usage', np.float64),
+        ('memory_usage', np.float64),
+        ('confidence_score', np.float64),
+        ('error_message', object),
+    )
+    FIELDS = tuple(name for name, _ in _COLUMNS)
+    
+    def __init__(self, capacity: int):
+        """
+        Allocate the history arrays
+        
+        Args:
+            capacity: Maximum number of scans to retain
+        """
+        self.capacity = max(int(capacity), 1)
+        self._columns = {name: np.empty(2 * self.capacity, dtype=dtype) for name, dtype in self._COLUMNS}
+        self._lo = 0
+        self._hi = 0
+    
+    def __len__(self) -> int:
+        return self._hi - self._lo
+    
+    def append(self, timestamp: float, scan_number: int, duration: float, success: bool,
+               coordinates_found: int, cpu_usage: float, memory_usage: float,
+               confidence_score: Optional[float] = None, error_message: Optional[str] = None):
+        """Append one scan, evicting the oldest when the history is full"""
+        columns = self._columns
+        if self._hi == 2 * self.capacity:
+            count = self._hi - self._lo
+            for column in columns.values():
+                column[:count] = column[self._lo:self._hi]
+            columns['error_message'][count:] = None
+            self._lo, self._hi = 0, count
+        
+        i = self._hi
+        columns['timestamp'][i] = timestamp
+        columns['scan_number'][i] = scan_number
+        columns['duration'][i] = duration
+        columns['success'][i] = success
+        columns['coordinates_found'][i] = coordinates_found
+        columns['cpu_usage'][i] = cpu_usage
+        columns['memory_usage'][i] = memory_usage
+        columns['confidence_score'][i] = np.nan if confidence_score is None else confidence_score
+        columns['error_message'][i] = error_message
+        
+        self._hi = i + 1
+        if self._hi - self._lo > self.capacity:
+            columns['error_message'][self._lo] = None
+            self._lo += 1
+    
+    def column(self, name: str) -> np.ndarray:
+        """Get a read-only view of one field, oldest scan first"""
+        view = self._columns[name][self._lo:self._hi]
+        view.flags.writeable = False
+        return view
+    
+    def index_since(self, cutoff_time: float) -> int:
+        """Get the position of the first scan recorded at or after cutoff_time"""
+        return int(np.searchsorted(self._columns['timestamp'][self._lo:self._hi], cutoff_time, side='left'))
+    
+    def iter_dicts(self, cutoff_time: Optional[float] = None) -> Iterator[Dict]:
+        """
+        Iterate over scans as ScanMetrics-shaped dicts
+        
+        Args:
+            cutoff_time: Oldest timestamp to include, or None for all scans
+        
+        Yields:
+            One scan dict with plain Python values at a time, oldest first
+        """
+        start = self._lo if cutoff_time is None else self._lo + self.index_since(cutoff_time)
+        values = [self._columns[name][start:self._hi].tolist() for name in self.FIELDS]
+        confidence = self.FIELDS.index('confidence_score')
+        values[confidence] = [None if score != score else score for score in values[confidence]]
+        yield from map(_scan_dict, *values)
+    
+    def to_dicts(self, cutoff_time: Optional[float] = None) -> List[Dict]:
+        """Get scans at or after cutoff_time (all if None) as a list of dicts"""
+        return list(self.iter_dicts(cutoff_time))
+    
+    def discard_before(self, cutoff_time: float):
+        """Drop scans recorded before cutoff_time"""
+        start = self._lo + self.index_since(cutoff_time)
+        self._columns['error_message'][self._lo:start] = None
+        self._lo = start
+    
+    def clear(self):
+        """Drop all scans"""
+        self._columns['error_message'][:] = None
+        self._lo = self._hi = 0
+
+class _ReadWriteLock:
+    """Reader-preferring read/write lock.
+
+    Any number of readers may hold the lock at once; a writer waits until
+    no reader or other writer holds it. Readers only wait for an active
+    writer, so a thread may nest read sections (e.g. export_data calling
+    get_current_stats) without deadlocking.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+
+    @contextmanager
+    def read_lock(self):
+        """Holds the lock in shared mode for the duration of the block"""
+        with self._cond:
+            while self._writer:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write_lock(self):
+        """Holds the lock in exclusive mode for the duration of the block"""
+        with self._cond:
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
 class StatisticsManager:
     """Manages all statistics and performance monitoring for the detection system"""
     
+    # Minimum seconds between system health samples; a sample younger than
+    # this is reused by record_scan instead of querying psutil again
+    HEALTH_SAMPLE_INTERVAL = 5.0
+    
+    # Disk usage and temperature are refreshed once every this many samples
+    SLOW_SAMPLE_EVERY = 20
+    
+    # Number of recent scans averaged into avg_scan_time
+    ROLLING_WINDOW = 100
+    
+    # Seconds for which get_current_stats reuses its last result
+    STATS_CACHE_TTL = 0.1
+    
     def __init__(self, max_history_size: int = None, data_retention_hours: int = None):
         """
         Initialize the statistics manager
@@ -79,13 +294,19 @@ class StatisticsManager:
         self.max_history_size = max_history_size
         self.data_retention_hours = data_retention_hours
         self.start_time = time.time()
+        self._session_start_iso = datetime.fromtimestamp(self.start_time).isoformat()
+        
+        # Last get_current_stats result as (monotonic time, sections, stats)
+        self._stats_cache: Optional[Tuple[float, Optional[FrozenSet[str]], Dict[str, Any]]] = None
         
-        # Thread-safe data structures
-        self._lock = threading.RLock()
+        # Thread-safe data structures: UI polling only reads, so readers
+        # share the lock and only recording/monitoring takes it exclusively
+        self._lock = _ReadWriteLock()
         
         # Scan metrics storage
-        self.scan_history: deque = deque(maxlen=max_history_size)
+        self.scan_history = ScanHistory(max_history_size)
         self.system_health_history: deque = deque(maxlen=max_history_size)
+        self._latest_health: Optional[SystemHealth] = None
         
         # Initialize statistics from config if available
         initial_stats = getattr(static_config, 'get_initial_stats', lambda: {})() if static_config else {}
@@ -103,192 +324,310 @@ class StatisticsManager:
         self.max_scan_time = initial_performance.get('max_scan_time', 0.0)
         self.last_scan_time = initial_performance.get('last_scan_time', 0.0)
         
+        # Durations of the last ROLLING_WINDOW scans and their running sum
+        self._window: deque = deque(maxlen=self.ROLLING_WINDOW)
+        self._window_sum = 0.0
+        
         # Session statistics
-        self.session_start = datetime.now()
-        self.last_detection_time = None
+        # Timestamps are stored as time.time() floats and only turned into
+        # datetimes when the stats are serialized
+        self.last_detection_ts: Optional[float] = None
         self.detection_streak = 0
         self.longest_streak = 0
         
-        # Click tracking
+        # Click tracking: the counters have their own plain lock so a click
+        # never waits for a reader building a stats snapshot
+        self._click_lock = threading.Lock()
         self.total_clicks = 0
         self.successful_clicks = 0
         self.failed_clicks = 0
         
         # Error tracking
-        self.error_counts = defaultdict(int)
+        # Per-message counts are one-element lists so a repeat of the last
+        # error can be counted through _last_error_cell without a dict lookup
+        self._error_cells: Dict[str, List[int]] = {}
+        self._last_error: Optional[str] = None
+        self._last_error_cell: List[int] = [0]
         self.recent_errors = deque(maxlen=100)
+        self._error_types: Optional[Dict[str, int]] = None  # Snapshot of error_counts, rebuilt after new errors
         
-        # Next scan timing
-        self.next_scan_time = None
+        # Next scan timing (time.monotonic() deadline)
+        self._next_scan_deadline: Optional[float] = None
         self.scan_interval = 0
         
         # Process-specific metrics
         self.process = psutil.Process(os.getpid())
+        self._cpu_count = psutil.cpu_count() or 1
+        self.process.cpu_percent()  # Prime so the first sample is meaningful
         self.process_cpu_percent = 0.0
         self.process_memory_mb = 0.0
         self.process_memory_percent = 0.0
         
-        # System monitoring
+        # System monitoring: sampled inline by tick() instead of a
+        # dedicated thread; the first call samples immediately
         self.system_monitor_active = True
-        self.system_monitor_thread = threading.Thread(target=self._monitor_system_health, daemon=True)
-        self.system_monitor_thread.start()
+        self._health_sample_lock = threading.Lock()
+        self._health_deadline = time.monotonic()
+        self._health_samples = 0
+        self._cached_disk = 0.0
+        self._disk_path = 'C:' if os.name == 'nt' else '/'
+        self._cached_temp: Optional[float] = None
     
     def record_scan(self, scan_number: int, duration: float, success: bool, 
                    coordinates_count: int = 0, confidence_score: Optional[float] = None,
                    error_message: Optional[str] = None):
         """Record metrics for a completed scan"""
-        with self._lock:
-            # Get current system metrics
-            cpu_usage = psutil.cpu_percent()
-            memory_usage = psutil.virtual_memory().percent
-            
-            # Create scan metrics record
-            metrics = ScanMetrics(
-                timestamp=time.time(),
-                scan_number=scan_number,
-                duration=duration,
-                success=success,
-                coordinates_found=coordinates_count,
-                cpu_usage=cpu_usage,
-                memory_usage=memory_usage,
-                confidence_score=confidence_score,
-                error_message=error_message
-            )
-            
-            # Add to history
-            self.scan_history.append(metrics)
-            
-            # Update counters
-            self.total_scans += 1
-            if success:
-                self.successful_scans += 1
-                self.total_detections += coordinates_count
-                self.last_detection_time = datetime.now()
-                self.detection_streak += 1
-                self.longest_streak = max(self.longest_streak, self.detection_streak)
-            else:
-                self.failed_scans += 1
-                self.detection_streak = 0
-                if error_message:
-                    self.error_counts[error_message] += 1
-                    self.recent_errors.append({
-                        'timestamp': time.time(),
-                        'scan_number': scan_number,
-                        'error': error_message
-                    })
-            
-            # Update performance metrics
-            self.last_scan_time = duration
-            self.min_scan_time = min(self.min_scan_time, duration)
-            self.max_scan_time = max(self.max_scan_time, duration)
-            
-            # Calculate rolling average
-            recent_scans = list(self.scan_history)[-100:]  # Last 100 scans
-            if recent_scans:
-                self.avg_scan_time = sum(s.duration for s in recent_scans) / len(recent_scans)
+        self.tick()
+        now = time.time()
+        cpu_usage, memory_usage = self._current_usage(now)
+        
+        with self._lock.write_lock():
+            self._record_scan_locked(now, cpu_usage, memory_usage, scan_number, duration, success,
+                                     coordinates_count, confidence_score, error_message)
+    
+    def record_scans_batch(self, scans: Iterable[Tuple]):
+        """
+        Record several completed scans at once
+        
+        Takes the write lock and reads the system usage once for the whole
+        batch instead of once per scan. All scans share the same timestamp
+        and usage values.
+        
+        Args:
+            scans: Tuples of record_scan arguments in positional order
+                (scan_number, duration, success[, coordinates_count
+                [, confidence_score[, error_message]]])
+        """
+        self.tick()
+        now = time.time()
+        cpu_usage, memory_usage = self._current_usage(now)
+        record = self._record_scan_locked
+        
+        with self._lock.write_lock():
+            for scan in scans:
+                record(now, cpu_usage, memory_usage, *scan)
+    
+    def _current_usage(self, now: float) -> Tuple[float, float]:
+        """Get (cpu_percent, memory_percent), reusing the latest health sample when fresh"""
+        health = self._latest_health
+        if health is not None and now - health.timestamp <= self.HEALTH_SAMPLE_INTERVAL:
+            return health.cpu_percent, health.memory_percent
+        return psutil.cpu_percent(), psutil.virtual_memory().percent
+    
+    def _record_scan_locked(self, now: float, cpu_usage: float, memory_usage: float,
+                            scan_number: int, duration: float, success: bool,
+                            coordinates_count: int = 0, confidence_score: Optional[float] = None,
+                            error_message: Optional[str] = None):
+        """Update history and counters for one scan; the caller holds the write lock"""
+        # Add to history
+        self.scan_history.append(
+            timestamp=now,
+            scan_number=scan_number,
+            duration=duration,
+            success=success,
+            coordinates_found=coordinates_count,
+            cpu_usage=cpu_usage,
+            memory_usage=memory_usage,
+            confidence_score=confidence_score,
+            error_message=error_message
+        )
+        
+        # Update counters
+        self.total_scans += 1
+        if success:
+            self.successful_scans += 1
+            self.total_detections += coordinates_count
+            self.last_detection_ts = now
+            self.detection_streak += 1
+            self.longest_streak = max(self.longest_streak, self.detection_streak)
+        else:
+            self.failed_scans += 1
+            self.detection_streak = 0
+            if error_message:
+                if error_message is self._last_error or error_message == self._last_error:
+                    self._last_error_cell[0] += 1
+                else:
+                    cell = self._error_cells.get(error_message)
+                    if cell is None:
+                        cell = self._error_cells[error_message] = [0]
+                    cell[0] += 1
+                    self._last_error = error_message
+                    self._last_error_cell = cell
+                self._error_types = None
+                self.recent_errors.append(ErrorRecord(now, scan_number, error_message))
+        
+        # Update performance metrics
+        self.last_scan_time = duration
+        self.min_scan_time = min(self.min_scan_time, duration)
+        self.max_scan_time = max(self.max_scan_time, duration)
+        
+        # Update the rolling average in O(1)
+        window = self._window
+        if len(window) == window.maxlen:
+            self._window_sum -= window[0]
+        window.append(duration)
+        self._window_sum += duration
+        self.avg_scan_time = self._window_sum / len(window)
+    
+    @property
+    def error_counts(self) -> Counter:
+        """Number of failed scans recorded per error message"""
+        return Counter({error: cell[0] for error, cell in self._error_cells.items()})
     
     def record_click(self, coordinates: Optional[Tuple[int, int]] = None, success: bool = True):
         """Record a click event"""
-        with self._lock:
+        with self._click_lock:
             self.total_clicks += 1
             if success:
                 self.successful_clicks += 1
             else:
                 self.failed_clicks += 1
     
-    def _monitor_system_health(self):
-        """Background thread to monitor system health"""
-        while self.system_monitor_active:
-            try:
-                with self._lock:
-                    # Update process-specific metrics
-                    try:
-                        # Get CPU percent with interval for more accurate reading
-                        # Divide by CPU count to normalize to system-wide percentage
-                        raw_cpu = self.process.cpu_percent()
-                        cpu_count = psutil.cpu_count()
-                        self.process_cpu_percent = raw_cpu / cpu_count if cpu_count > 0 else raw_cpu
-                        
-                        memory_info = self.process.memory_info()
-                        self.process_memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
-                        self.process_memory_percent = self.process.memory_percent()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        # Process might have changed, reinitialize
-                        self.process = psutil.Process(os.getpid())
-                    
-                    # Get system memory info
-                    memory_info = psutil.virtual_memory()
-                    
-                    health = SystemHealth(
-                        timestamp=time.time(),
-                        cpu_percent=psutil.cpu_percent(),
-                        memory_percent=memory_info.percent,
-                        memory_used_mb=memory_info.used / 1024 / 1024,  # Convert to MB
-                        memory_total_mb=memory_info.total / 1024 / 1024,  # Convert to MB
-                        disk_usage=psutil.disk_usage('/').percent if os.name != 'nt' else psutil.disk_usage('C:').percent,
-                        active_threads=threading.active_count(),
-                        uptime=time.time() - self.start_time
-                    )
-                    
-                    # Try to get CPU temperature (if available)
-                    try:
-                        temps = psutil.sensors_temperatures()
-                        if temps:
-                            # Get first available temperature sensor
-                            for name, entries in temps.items():
-                                if entries:
-                                    health.temperature = entries[0].current
-                                    break
-                    except (AttributeError, OSError):
-                        pass  # Temperature monitoring not available
-                    
-                    self.system_health_history.append(health)
-                
-                time.sleep(5)  # Update every 5 seconds
-            except Exception as e:
-                print(f"Error in system health monitoring: {e}")
-                time.sleep(10)  # Wait longer on error
-    
-    def get_current_stats(self) -> Dict[str, Any]:
-        """Get current statistics summary"""
-        with self._lock:
-            uptime = time.time() - self.start_time
-            success_rate = (self.successful_scans / self.total_scans * 100) if self.total_scans > 0 else 0
-            
-            # Get recent system health
-            recent_health = list(self.system_health_history)[-1] if self.system_health_history else None
+    def tick(self) -> bool:
+        """
+        Sample system health if the sampling interval has elapsed
+        
+        Called from record_scan and get_current_stats, and can be called from
+        any periodic loop when the manager is used standalone. Only one
+        thread samples at a time; concurrent callers return immediately.
+        
+        Returns:
+            True if a new health sample was recorded
+        """
+        if not self.system_monitor_active or time.monotonic() < self._health_deadline:
+            return False
+        if not self._health_sample_lock.acquire(blocking=False):
+            return False
+        try:
+            self._health_deadline = time.monotonic() + self.HEALTH_SAMPLE_INTERVAL
+            health = self._sample_system_health()
+            with self._lock.write_lock():
+                self.system_health_history.append(health)
+            self._latest_health = health
+            return True
+        except Exception as e:
+            print(f"Error in system health monitoring: {e}")
+            return False
+        finally:
+            self._health_sample_lock.release()
+    
+    def _sample_system_health(self) -> SystemHealth:
+        """Take one system health snapshot and refresh the process metrics"""
+        # Update process-specific metrics
+        try:
+            # Divide by CPU count to normalize to system-wide percentage
+            self.process_cpu_percent = self.process.cpu_percent() / self._cpu_count
+        
+            memory_info = self.process.memory_info()
+            self.process_memory_mb = memory_info.rss / 1024 / 1024  # Convert to MB
+            self.process_memory_percent = self.process.memory_percent()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # Process might have changed, reinitialize
+            self.process = psutil.Process(os.getpid())
+            self.process.cpu_percent()
+        
+        # Disk usage and temperatures change slowly and are comparatively
+        # expensive to read, so only refresh them every SLOW_SAMPLE_EVERY samples
+        if self._health_samples % self.SLOW_SAMPLE_EVERY == 0:
+            self._cached_disk = psutil.disk_usage(self._disk_path).percent
+            self._cached_temp = self._read_temperature()
+        self._health_samples += 1
+        
+        # Get system memory info
+        memory_info = psutil.virtual_memory()
+        
+        return SystemHealth(
+            timestamp=time.time(),
+            cpu_percent=psutil.cpu_percent(),
+            memory_percent=memory_info.percent,
+            memory_used_mb=memory_info.used / 1024 / 1024,  # Convert to MB
+            memory_total_mb=memory_info.total / 1024 / 1024,  # Convert to MB
+            disk_usage=self._cached_disk,
+            active_threads=threading.active_count(),
+            uptime=time.time() - self.start_time,
+            temperature=self._cached_temp
+        )
+    
+    @staticmethod
+    def _read_temperature() -> Optional[float]:
+        """Read the first available CPU temperature sensor, if any"""
+        try:
+            temps = psutil.sensors_temperatures()
+            if temps:
+                # Get first available temperature sensor
+                for name, entries in temps.items():
+                    if entries:
+                        return entries[0].current
+        except (AttributeError, OSError):
+            pass  # Temperature monitoring not available
+        return None
+    
+    def get_current_stats(self, sections: Optional[FrozenSet[str]] = None) -> Dict[str, Any]:
+        """
+        Get current statistics summary
+        
+        Args:
+            sections: Names of the sections to build (e.g. frozenset({'scans'})),
+                or None for all of them
+        
+        Returns:
+            Dict with one entry per requested section. Calls repeated within
+            STATS_CACHE_TTL seconds with the same sections return the same
+            dict, so callers must treat it as read-only.
+        """
+        cached = self._stats_cache
+        if cached is not None and cached[1] == sections and time.monotonic() - cached[0] < self.STATS_CACHE_TTL:
+            return cached[2]
+        
+        self.tick()
+        with self._lock.read_lock():
+            now = time.time()
+            stats = {}
             
-            return {
-                'session': {
-                    'start_time': self.session_start.isoformat(),
+            if sections is None or 'session' in sections:
+                uptime = now - self.start_time
+                stats['session'] = {
+                    'start_time': self._session_start_iso,
                     'uptime_seconds': uptime,
                     'uptime_formatted': self._format_duration(uptime)
-                },
-                'scans': {
+                }
+            if sections is None or 'scans' in sections:
+                success_rate = (self.successful_scans / self.total_scans * 100) if self.total_scans > 0 else 0
+                stats['scans'] = {
                     'total': self.total_scans,
                     'successful': self.successful_scans,
                     'failed': self.failed_scans,
                     'success_rate': round(success_rate, 2),
                     'total_detections': self.total_detections
-                },
-                'clicks': {
-                    'total': self.total_clicks,
-                    'successful': self.successful_clicks,
-                    'failed': self.failed_clicks,
-                    'success_rate': round((self.successful_clicks / self.total_clicks * 100) if self.total_clicks > 0 else 0, 2)
-                },
-                'performance': {
+                }
+            if sections is None or 'clicks' in sections:
+                with self._click_lock:
+                    total_clicks = self.total_clicks
+                    successful_clicks = self.successful_clicks
+                    failed_clicks = self.failed_clicks
+                stats['clicks'] = {
+                    'total': total_clicks,
+                    'successful': successful_clicks,
+                    'failed': failed_clicks,
+                    'success_rate': round((successful_clicks / total_clicks * 100) if total_clicks > 0 else 0, 2)
+                }
+            if sections is None or 'performance' in sections:
+                stats['performance'] = {
                     'avg_scan_time': round(self.avg_scan_time, 3),
                     'min_scan_time': round(self.min_scan_time, 3) if self.min_scan_time != float('inf') else 0,
                     'max_scan_time': round(self.max_scan_time, 3),
                     'last_scan_time': round(self.last_scan_time, 3)
-                },
-                'detection': {
-                    'last_detection': self.last_detection_time.isoformat() if self.last_detection_time else None,
+                }
+            if sections is None or 'detection' in sections:
+                stats['detection'] = {
+                    'last_detection': datetime.fromtimestamp(self.last_detection_ts).isoformat() if self.last_detection_ts else None,
                     'current_streak': self.detection_streak,
                     'longest_streak': self.longest_streak
-                },
-                'system': {
+                }
+            if sections is None or 'system' in sections:
+                # Get recent system health
+                recent_health = self._latest_health
+                stats['system'] = {
                     'cpu_percent': recent_health.cpu_percent if recent_health else 0,
                     'memory_percent': recent_health.memory_percent if recent_health else 0,
                     'memory_used_mb': round(recent_health.memory_used_mb, 2) if recent_health else 0,
@@ -296,40 +635,42 @@ class StatisticsManager:
                     'disk_usage': recent_health.disk_usage if recent_health else 0,
                     'active_threads': recent_health.active_threads if recent_health else 0,
                     'temperature': recent_health.temperature if recent_health and recent_health.temperature else None
-                },
-                'process': {
+                }
+            if sections is None or 'process' in sections:
+                stats['process'] = {
                     'cpu_percent': round(self.process_cpu_percent, 2),
                     'memory_mb': round(self.process_memory_mb, 2),
                     'memory_percent': round(self.process_memory_percent, 2)
-                },
-                'next_scan': {
-                    'scheduled_time': self.next_scan_time.isoformat() if self.next_scan_time else None,
-                    'seconds_remaining': max(0, int((self.next_scan_time - datetime.now()).total_seconds())) if self.next_scan_time else None,
+                }
+            if sections is None or 'next_scan' in sections:
+                remaining = self.get_time_until_next_scan()
+                stats['next_scan'] = {
+                    'scheduled_time': datetime.fromtimestamp(now + remaining).isoformat() if remaining is not None else None,
+                    'seconds_remaining': int(remaining) if remaining is not None else None,
                     'interval_seconds': self.scan_interval
-                },
-                'errors': {
+                }
+            if sections is None or 'errors' in sections:
+                if self._error_types is None:
+                    self._error_types = dict(self.error_counts)
+                stats['errors'] = {
                     'total_errors': len(self.recent_errors),
-                    'error_types': dict(self.error_counts),
-                    'recent_errors': list(self.recent_errors)[-10:]  # Last 10 errors
+                    'error_types': self._error_types,
+                    'recent_errors': [error._asdict() for error in islice(reversed(self.recent_errors), 10)][::-1]  # Last 10 errors
                 }
-            }
+        
+        self._stats_cache = (time.monotonic(), sections, stats)
+        return stats
     
     def get_historical_data(self, hours: int = 1) -> Dict[str, List[Dict]]:
         """Get historical data for the specified time period"""
-        with self._lock:
+        with self._lock.read_lock():
             cutoff_time = time.time() - (hours * 3600)
             
             # Filter scan history
-            recent_scans = [
-                asdict(scan) for scan in self.scan_history 
-                if scan.timestamp >= cutoff_time
-            ]
+            recent_scans = self.scan_history.to_dicts(cutoff_time)
             
             # Filter system health history
-            recent_health = [
-                asdict(health) for health in self.system_health_history 
-                if health.timestamp >= cutoff_time
-            ]
+            recent_health = _record_dicts(self.system_health_history, cutoff_time)
             
             return {
                 'scans': recent_scans,
@@ -341,58 +682,122 @@ class StatisticsManager:
                 }
             }
     
+    def get_historical_view(self, hours: float = 1) -> Dict[str, np.ndarray]:
+        """
+        Get zero-copy views of the scan history for the specified time period
+        
+        Unlike get_historical_data this builds no per-scan dicts, which suits
+        consumers that only reduce the data (histograms, rates, plots).
+        
+        Args:
+            hours: Hours of history to include
+        
+        Returns:
+            Dict mapping each ScanMetrics field to a read-only array view,
+            oldest scan first. A NaN confidence_score means unknown. The
+            views share memory with the history and are only guaranteed to
+            stay unchanged until the next scan is recorded; copy them to
+            keep them longer.
+        """
+        with self._lock.read_lock():
+            history = self.scan_history
+            start = history.index_since(time.time() - hours * 3600)
+            return {name: history.column(name)[start:] for name in history.FIELDS}
+    
+    def windowed_success_rate(self, seconds: float) -> Optional[float]:
+        """
+        Get the scan success rate over a recent time window
+        
+        Args:
+            seconds: Length of the window ending now
+        
+        Returns:
+            Percentage of successful scans in the window, or None if no
+            scan was recorded in it
+        """
+        with self._lock.read_lock():
+            history = self.scan_history
+            success = history.column('success')[history.index_since(time.time() - seconds):]
+            if not len(success):
+                return None
+            return np.count_nonzero(success) / len(success) * 100
+    
     def export_data(self, filepath: str, format: str = 'json'):
-        """Export statistics data to file"""
-        with self._lock:
-            data = {
-                'export_info': {
-                    'timestamp': datetime.now().isoformat(),
-                    'format': format,
-                    'total_scans': len(self.scan_history),
-                    'total_health_records': len(self.system_health_history)
-                },
-                'current_stats': self.get_current_stats(),
-                'scan_history': [asdict(scan) for scan in self.scan_history],
-                'system_health_history': [asdict(health) for health in self.system_health_history]
+        """
+        Export statistics data to file
+        
+        The history is written one record per line as it is serialized, so
+        the export never holds a second full copy of it in memory.
+        
+        Args:
+            filepath: Destination file path
+            format: Export format; only 'json' is supported
+        """
+        if format.lower() != 'json':
+            raise ValueError(f"Unsupported export format: {format}")
+        
+        # Built before taking the lock: get_current_stats may record a
+        # health sample, which needs the write lock
+        current_stats = self.get_current_stats()
+        
+        with self._lock.read_lock(), open(filepath, 'w') as f:
+            export_info = {
+                'timestamp': datetime.now().isoformat(),
+                'format': format,
+                'total_scans': len(self.scan_history),
+                'total_health_records': len(self.system_health_history)
             }
-            
-            if format.lower() == 'json':
-                with open(filepath, 'w') as f:
-                    json.dump(data, f, indent=2, default=str)
-            else:
-                raise ValueError(f"Unsupported export format: {format}")
+            f.write('{\n"export_info": ')
+            json.dump(export_info, f)
+            f.write(',\n"current_stats": ')
+            json.dump(current_stats, f, default=str)
+            f.write(',\n"scan_history": [')
+            for i, scan in enumerate(self.scan_history.iter_dicts()):
+                f.write(',\n' if i else '\n')
+                json.dump(scan, f)
+            f.write('\n],\n"system_health_history": [')
+            for i, health in enumerate(self.system_health_history):
+                f.write(',\n' if i else '\n')
+                json.dump(vars(health), f)
+            f.write('\n]\n}\n')
     
     def reset_statistics(self):
         """Reset all statistics (keep system health monitoring active)"""
-        with self._lock:
+        with self._lock.write_lock():
             self.scan_history.clear()
             self.total_scans = 0
             self.successful_scans = 0
             self.failed_scans = 0
             self.total_detections = 0
-            self.total_clicks = 0
-            self.successful_clicks = 0
-            self.failed_clicks = 0
+            with self._click_lock:
+                self.total_clicks = 0
+                self.successful_clicks = 0
+                self.failed_clicks = 0
             self.avg_scan_time = 0.0
+            self._window.clear()
+            self._window_sum = 0.0
             self.min_scan_time = float('inf')
             self.max_scan_time = 0.0
             self.last_scan_time = 0.0
-            self.session_start = datetime.now()
-            self.last_detection_time = None
+            self.last_detection_ts = None
             self.detection_streak = 0
             self.longest_streak = 0
-            self.error_counts.clear()
+            self._error_cells.clear()
+            self._last_error = None
+            self._last_error_cell = [0]
+            self._error_types = None
             self.recent_errors.clear()
             self.start_time = time.time()
+            self._session_start_iso = datetime.fromtimestamp(self.start_time).isoformat()
+            self._stats_cache = None
     
     def cleanup_old_data(self):
         """Remove data older than retention period"""
-        with self._lock:
+        with self._lock.write_lock():
             cutoff_time = time.time() - (self.data_retention_hours * 3600)
             
             # Clean scan history
-            while self.scan_history and self.scan_history[0].timestamp < cutoff_time:
-                self.scan_history.popleft()
+            self.scan_history.discard_before(cutoff_time)
             
             # Clean system health history
             while self.system_health_history and self.system_health_history[0].timestamp < cutoff_time:
@@ -401,30 +806,27 @@ class StatisticsManager:
     def stop_monitoring(self):
         """Stop system health monitoring"""
         self.system_monitor_active = False
-        if self.system_monitor_thread.is_alive():
-            self.system_monitor_thread.join(timeout=5)
     
     def set_next_scan_time(self, scan_interval: float):
         """Set the time for the next scan"""
-        with self._lock:
+        with self._lock.write_lock():
             self.scan_interval = scan_interval
-            self.next_scan_time = datetime.now() + timedelta(seconds=scan_interval)
+            self._next_scan_deadline = time.monotonic() + scan_interval
     
     def get_time_until_next_scan(self) -> Optional[float]:
         """Get seconds remaining until next scan"""
-        with self._lock:
-            if self.next_scan_time:
-                remaining = (self.next_scan_time - datetime.now()).total_seconds()
-                return max(0, remaining)
+        with self._lock.read_lock():
+            if self._next_scan_deadline is not None:
+                return max(0, self._next_scan_deadline - time.monotonic())
             return None
     
     def update_scan_interval(self, new_interval: float):
         """Update the scan interval and recalculate next scan time"""
-        with self._lock:
+        with self._lock.write_lock():
             self.scan_interval = new_interval
-            if self.next_scan_time:
+            if self._next_scan_deadline is not None:
                 # Adjust next scan time based on new interval
-                self.next_scan_time = datetime.now() + timedelta(seconds=new_interval)
+                self._next_scan_deadline = time.monotonic() + new_interval
     
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -438,13 +840,25 @@ class StatisticsManager:
             hours = seconds / 3600
             return f"{hours:.1f}h"
     
-    def __del__(self):
-        """Cleanup when object is destroyed"""
+    def close(self):
+        """Stop monitoring; the manager keeps serving the stats collected so far"""
         self.stop_monitoring()
+    
+    def __enter__(self) -> 'StatisticsManager':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
-# Global statistics manager instance
-stats_manager = StatisticsManager()
+# Global statistics manager instance, created on first use
+stats_manager: Optional[StatisticsManager] = None
+_stats_manager_lock = threading.Lock()
 
 def get_stats_manager() -> StatisticsManager:
     """Get the global statistics manager instance"""
+    global stats_manager
+    if stats_manager is None:
+        with _stats_manager_lock:
+            if stats_manager is None:
+                stats_manager = StatisticsManager()
     return stats_manager
\ No newline at end of file
@@ -18,24 +18,27 @@ Author: Matteo Sala
 Version: 1.0.0
 """
 
+import asyncio
 import threading
 import time
 import signal
 import sys
+import inspect
+import weakref
 from datetime import datetime
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, Tuple
 from enum import Enum
 
 # Import detection system modules
 try:
     from config import (
         SCAN_INTERVAL, TARGET_PATTERN, TARGET_END_WORD,
-        MAX_CONSECUTIVE_FAILURES, EXTENDED_WAIT_TIME
+        MAX_CONSECUTIVE_FAILURES, EXTENDED_WAIT_TIME, STATUS_REPORT_FREQUENCY
     )
     from logger import (
         setup_logging, log_message, log_error, log_debug,
         log_system_startup, log_system_shutdown, log_scan_interval,
-        should_log_status_report, log_system_status, get_stats_copy
+        log_system_status, get_stats_copy, is_info_enabled
     )
     from scanner import (
         perform_scan_with_retry, handle_scan_result, handle_consecutive_failures,
@@ -64,24 +67,74 @@ class SystemState(Enum):
     STOPPING = "stopping"
     ERROR = "error"
 
+def _callback_ref(callback: Callable) -> Callable[[], Optional[Callable]]:
+    """Reference bound methods weakly so a registration never keeps its owner alive"""
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+def _wrap_safe(callback_ref: Callable[[], Optional[Callable]], kind: str) -> Callable:
+    """Build the dispatcher for one registered callback
+    
+    The dispatcher skips a collected callback and logs instead of raising,
+    so dispatch loops call it directly with no per-callback handling.
+    """
+    def dispatch(*args):
+        callback = callback_ref()
+        if callback is None:
+            return
+        try:
+            callback(*args)
+        except Exception as e:
+            log_error(f"Error in {kind} callback: {e}")
+    return dispatch
+
+def _callback_entry(name: str, callback: Callable, kind: str):
+    """Build the (name, callback ref, dispatcher) entry stored for a callback"""
+    callback_ref = _callback_ref(callback)
+    return (name, callback_ref, _wrap_safe(callback_ref, kind))
+
+def _without_callback(callbacks, name):
+    """Return a callback tuple without the entry for name or dead references"""
+    return tuple(entry for entry in callbacks if entry[0] != name and entry[1]() is not None)
+
 class SystemController:
     """Central controller for the detection system"""
     
     def __init__(self):
         """Initialize the system controller"""
         self._state = SystemState.STOPPED
-        self._state_lock = threading.RLock()
+        self._state_lock = threading.Lock()
         self._scan_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._pause_event = threading.Event()
+        # Set whenever the scan loop may proceed (not paused, or stopping)
+        self._resume_event = threading.Event()
+        # Set by the scan thread once it has entered its loop
+        self._ready_event = threading.Event()
+        
+        # Async scan path: the event loop running _scan_loop_async and its
+        # asyncio mirrors of the stop/resume events (None on the thread path)
+        self._scan_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_stop: Optional[asyncio.Event] = None
+        self._async_resume: Optional[asyncio.Event] = None
         
-        # Callbacks for state changes
-        self._state_callbacks: Dict[str, Callable] = {}
-        self._scan_callbacks: Dict[str, Callable] = {}
+        # Callbacks for state changes, as immutable (name, callback ref,
+        # dispatcher) tuples. Writers replace a tuple under _callback_lock;
+        # dispatch iterates whichever tuple it loaded, without locking
+        self._callback_lock = threading.Lock()
+        self._state_callbacks: Tuple[Tuple[str, Callable[[], Optional[Callable]], Callable], ...] = ()
+        self._scan_callbacks: Tuple[Tuple[str, Callable[[], Optional[Callable]], Callable], ...] = ()
         
         # Statistics
         self._start_time: Optional[datetime] = None
         self._last_scan_time: Optional[datetime] = None
+        # ISO strings of the times above, formatted once when they are set
+        self._start_time_iso: Optional[str] = None
+        # time.monotonic() at start, for uptime immune to clock changes
+        self._start_monotonic: Optional[float] = None
+        self._last_scan_time_iso: Optional[str] = None
         self._scan_count = 0
         
         # Current activity tracking
@@ -93,8 +146,8 @@ class SystemController:
         
     def get_state(self) -> SystemState:
         """Get current system state"""
-        with self._state_lock:
-            return self._state
+        # A single attribute load is atomic; the lock only serializes writers
+        return self._state
     
     def is_running(self) -> bool:
         """Check if system is running"""
@@ -142,30 +195,32 @@ class SystemController:
         with self._state_lock:
             old_state = self._state
             self._state = new_state
-            log_debug(f"System state changed: {old_state.value} -> {new_state.value}")
-            
-            # Notify state change callbacks
-            for callback in self._state_callbacks.values():
-                try:
-                    callback(old_state, new_state)
-                except Exception as e:
-                    log_error(f"Error in state callback: {e}")
+        log_debug(f"System state changed: {old_state.value} -> {new_state.value}")
+        
+        # Notify state change callbacks outside the lock so they may query
+        # the controller
+        for _, _, dispatch in self._state_callbacks:
+            dispatch(old_state, new_state)
     
     def add_state_callback(self, name: str, callback: Callable):
-        """Add a callback for state changes"""
-        self._state_callbacks[name] = callback
+        """Add a callback for state changes (bound methods are held weakly)"""
+        with self._callback_lock:
+            self._state_callbacks = _without_callback(self._state_callbacks, name) + (_callback_entry(name, callback, "state"),)
     
     def remove_state_callback(self, name: str):
         """Remove a state change callback"""
-        self._state_callbacks.pop(name, None)
+        with self._callback_lock:
+            self._state_callbacks = _without_callback(self._state_callbacks, name)
     
     def add_scan_callback(self, name: str, callback: Callable):
-        """Add a callback for scan events"""
-        self._scan_callbacks[name] = callback
+        """Add a callback for scan events (bound methods are held weakly)"""
+        with self._callback_lock:
+            self._scan_callbacks = _without_callback(self._scan_callbacks, name) + (_callback_entry(name, callback, "scan"),)
     
     def remove_scan_callback(self, name: str):
         """Remove a scan event callback"""
-        self._scan_callbacks.pop(name, None)
+        with self._callback_lock:
+            self._scan_callbacks = _without_callback(self._scan_callbacks, name)
     
     def start_system(self) -> bool:
         """Start the detection system"""
@@ -179,6 +234,8 @@ class SystemController:
             # Reset events
             self._stop_event.clear()
             self._pause_event.clear()
+            self._resume_event.set()
+            self._ready_event.clear()
             
             # Start scan thread
             self._scan_thread = threading.Thread(
@@ -188,12 +245,12 @@ class SystemController:
             )
             self._scan_thread.start()
             
-            # Wait a moment to ensure thread started
-            time.sleep(0.1)
-            
-            if self._scan_thread.is_alive():
+            # Wait until the scan thread reports it is running
+            if self._ready_event.wait(timeout=2.0) and self._scan_thread.is_alive():
                 self._set_state(SystemState.RUNNING)
                 self._start_time = datetime.now()
+                self._start_monotonic = time.monotonic()
+                self._start_time_iso = self._start_time.isoformat()
                 log_system_startup()
                 log_message(f"🎯 Target: '{TARGET_PATTERN}'")
                 log_message(f"🔍 Final word: '{TARGET_END_WORD}'")
@@ -209,6 +266,73 @@ class SystemController:
             log_error(f"Error starting system: {e}")
             return False
     
+    async def start_system_async(self) -> bool:
+        """Start the detection system as a task on the running event loop
+        
+        For hosts that already run an asyncio loop: the scan loop becomes a
+        coroutine instead of a dedicated thread, and only the blocking scan
+        work is handed to the loop's default executor.
+        """
+        if not self.can_start():
+            log_error(f"Cannot start system in state: {self.get_state().value}")
+            return False
+        
+        try:
+            self._set_state(SystemState.STARTING)
+            
+            # Reset events
+            self._stop_event.clear()
+            self._pause_event.clear()
+            self._resume_event.set()
+            self._ready_event.clear()
+            self._loop = asyncio.get_running_loop()
+            self._async_stop = asyncio.Event()
+            self._async_resume = asyncio.Event()
+            self._async_resume.set()
+            
+            self._scan_task = self._loop.create_task(self._scan_loop_async())
+            
+            # Let the task enter its loop
+            await asyncio.sleep(0)
+            if self._ready_event.is_set() and not self._scan_task.done():
+                self._set_state(SystemState.RUNNING)
+                self._start_time = datetime.now()
+                self._start_monotonic = time.monotonic()
+                self._start_time_iso = self._start_time.isoformat()
+                log_system_startup()
+                log_message(f"🎯 Target: '{TARGET_PATTERN}'")
+                log_message(f"🔍 Final word: '{TARGET_END_WORD}'")
+                log_message("🤖 Mode: AUTOMATIC - Automatic click without confirmation")
+                return True
+            else:
+                self._set_state(SystemState.ERROR)
+                log_error("Failed to start scan task")
+                return False
+                
+        except Exception as e:
+            self._set_state(SystemState.ERROR)
+            log_error(f"Error starting system: {e}")
+            return False
+    
+    def _sync_async_events(self):
+        """Mirror the stop/resume events onto the async scan loop, if one is active"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        
+        def apply():
+            if self._async_stop is None:
+                return
+            if self._stop_event.is_set():
+                self._async_stop.set()
+            if self._resume_event.is_set():
+                self._async_resume.set()
+            else:
+                self._async_resume.clear()
+        
+        # asyncio events are not thread-safe; update them on their own loop
+        loop.call_soon_threadsafe(apply)
+    
     def stop_system(self) -> bool:
         """Stop the detection system"""
         current_state = self.get_state()
@@ -227,7 +351,13 @@ class SystemController:
             
             # Signal stop
             self._stop_event.set()
-            self._pause_event.set()  # Also unpause if paused
+            self._pause_event.set()
+            self._resume_event.set()  # Also unpause if paused
+            self._sync_async_events()
+            
+            # A scan task ends at its next wake-up; it cannot be joined
+            # from here since this may run on its own event loop
+            self._scan_task = None
             
             # Wait for thread to finish
             if self._scan_thread and self._scan_thread.is_alive():
@@ -255,7 +385,9 @@ class SystemController:
         
         try:
             self._set_state(SystemState.PAUSING)
+            self._resume_event.clear()
             self._pause_event.set()
+            self._sync_async_events()
             self._set_state(SystemState.PAUSED)
             log_message("🔄 System paused")
             return True
@@ -273,6 +405,8 @@ class SystemController:
         try:
             self._set_state(SystemState.RESUMING)
             self._pause_event.clear()
+            self._resume_event.set()
+            self._sync_async_events()
             self._set_state(SystemState.RUNNING)
             log_message("▶️ System resumed")
             return True
@@ -289,6 +423,9 @@ class SystemController:
             # Set stop events
             self._stop_event.set()
             self._pause_event.set()
+            self._resume_event.set()
+            self._sync_async_events()
+            self._scan_task = None
             
             # Force state to stopping
             self._set_state(SystemState.STOPPING)
@@ -312,129 +449,141 @@ class SystemController:
         with self._state_lock:
             info = {
                 'state': self._state.value,
-                'start_time': self._start_time.isoformat() if self._start_time else None,
-                'last_scan_time': self._last_scan_time.isoformat() if self._last_scan_time else None,
+                'start_time': self._start_time_iso,
+                'last_scan_time': self._last_scan_time_iso,
                 'scan_count': self._scan_count,
-                'uptime_seconds': (datetime.now() - self._start_time).total_seconds() if self._start_time else 0,
-                'thread_alive': self._scan_thread.is_alive() if self._scan_thread else False,
                 'current_activity': self._current_activity,
-                'current_activity_details': self._current_activity_details,
-                'can_start': self.can_start(),
-                'can_stop': self.can_stop(),
-                'can_pause': self.can_pause(),
-                'can_resume': self.can_resume()
+                'current_activity_details': self._current_activity_details
             }
+            start_monotonic = self._start_monotonic
+            scan_thread = self._scan_thread
+            scan_task = self._scan_task
+        
+        info['uptime_seconds'] = time.monotonic() - start_monotonic if start_monotonic is not None else 0
+        if scan_task is not None:
+            info['thread_alive'] = not scan_task.done()
+        else:
+            info['thread_alive'] = scan_thread.is_alive() if scan_thread else False
+        
+        # The can_* checks read the state without locking
+        info['can_start'] = self.can_start()
+        info['can_stop'] = self.can_stop()
+        info['can_pause'] = self.can_pause()
+        info['can_resume'] = self.can_resume()
+        
+        # Add statistics from logger
+        try:
+            stats = get_stats_copy()
+            info.update(stats)
+        except Exception as e:
+            log_error(f"Error getting stats: {e}")
+        
+        # Add statistics from statistics manager
+        try:
+            from statistics_manager import get_stats_manager
+            stats_mgr = get_stats_manager()
+            mgr_stats = stats_mgr.get_current_stats()
             
-            # Add statistics from logger
-            try:
-                stats = get_stats_copy()
-                info.update(stats)
-            except Exception as e:
-                log_error(f"Error getting stats: {e}")
-            
-            # Add statistics from statistics manager
-            try:
-                from statistics_manager import get_stats_manager
-                stats_mgr = get_stats_manager()
-                mgr_stats = stats_mgr.get_current_stats()
-                
-                # Add click statistics
-                if 'clicks' in mgr_stats:
-                    info['clicks_performed'] = mgr_stats['clicks']['total']
-                    info['successful_clicks'] = mgr_stats['clicks']['successful']
-                    info['failed_clicks'] = mgr_stats['clicks']['failed']
-                    info['click_success_rate'] = mgr_stats['clicks']['success_rate']
-                
-            except Exception as e:
-                log_error(f"Error getting statistics manager stats: {e}")
+            # Add click statistics
+            if 'clicks' in mgr_stats:
+                info['clicks_performed'] = mgr_stats['clicks']['total']
+                info['successful_clicks'] = mgr_stats['clicks']['successful']
+                info['failed_clicks'] = mgr_stats['clicks']['failed']
+                info['click_success_rate'] = mgr_stats['clicks']['success_rate']
             
-            return info
+        except Exception as e:
+            log_error(f"Error getting statistics manager stats: {e}")
+        
+        return info
     
     def _scan_loop(self):
         """Main scanning loop running in separate thread"""
         try:
             consecutive_failures = 0
+            iterations = 0
+            self._ready_event.set()
             
-            # Set initial next scan time for countdown
+            # Bind per-iteration lookups once
             from statistics_manager import get_stats_manager
-            get_stats_manager().set_next_scan_time(SCAN_INTERVAL)
+            stats_manager = get_stats_manager()
+            stop_is_set = self._stop_event.is_set
+            pause_is_set = self._pause_event.is_set
+            
+            # Set initial next scan time for countdown
+            stats_manager.set_next_scan_time(SCAN_INTERVAL)
             
-            while not self._stop_event.is_set():
+            while not stop_is_set():
                 try:
                     # Check if paused
-                    if self._pause_event.is_set():
+                    if pause_is_set():
                         self.set_current_activity("Paused", "System is paused")
-                        time.sleep(0.5)  # Short sleep while paused
+                        self._resume_event.wait()  # Woken by resume or stop
                         continue
                     
-                    # Check system health
-                    if not is_system_healthy():
-                        log_error("System unhealthy, continuing with caution...")
-                    
-                    # Get scan number
-                    scan_number = get_next_scan_number()
-                    self._scan_count = scan_number
-                    
-                    # Set activity to preparing scan
-                    self.set_current_activity("Preparing scan", f"Scan #{scan_number}")
-                    
-                    # Notify scan start callbacks
-                    for callback in self._scan_callbacks.values():
-                        try:
-                            callback('scan_start', {'scan_number': scan_number})
-                        except Exception as e:
-                            log_error(f"Error in scan callback: {e}")
-                    
-                    # Execute scan with retry
-                    self.set_current_activity("Scanning", f"Executing scan #{scan_number}")
-                    scan_start_time = time.time()
-                    success, coordinates = perform_scan_with_retry(scan_number)
-                    scan_time = time.time() - scan_start_time
-                    
-                    self._last_scan_time = datetime.now()
+                    iterations += 1
+                    consecutive_failures = self._scan_iteration(stats_manager, consecutive_failures, iterations)
                     
-                    # Handle scan result
-                    click_performed = False
-                    if success:
-                        self.set_current_activity("Processing result", f"Target found, handling click for scan #{scan_number}")
-                        click_performed = handle_scan_result(scan_number, success, coordinates)
-                        consecutive_failures = 0  # Reset on success
-                    else:
-                        consecutive_failures += 1
-                    
-                    # Log scan summary
-                    log_scan_summary(scan_number, success, click_performed, scan_time)
+                    # Wait for next scan (with interruption check)
+                    self._wait_for_next_scan()
                     
-                    # Notify scan complete callbacks
-                    for callback in self._scan_callbacks.values():
-                        try:
-                            callback('scan_complete', {
-                                'scan_number': scan_number,
-                                'success': success,
-                                'click_performed': click_performed,
-                                'scan_time': scan_time,
-                                'coordinates': coordinates
-                            })
-                        except Exception as e:
-                            log_error(f"Error in scan callback: {e}")
+                except Exception as e:
+                    log_error(f"Error in scan loop: {e}")
+                    consecutive_failures += 1
                     
-                    # Handle consecutive failures
-                    if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
-                        handle_consecutive_failures()
-                        consecutive_failures = 0  # Reset after handling
+                    # If too many errors, stop the system
+                    if consecutive_failures >= MAX_CONSECUTIVE_FAILURES * 2:
+                        log_error("Too many consecutive errors, stopping system")
+                        self._set_state(SystemState.ERROR)
+                        break
                     
-                    # Status report
-                    if should_log_status_report():
-                        log_system_status()
+                    # Short wait before retry, cut short by a stop
+                    self._stop_event.wait(1.0)
+            
+        except Exception as e:
+            log_error(f"Critical error in scan loop: {e}")
+            self._set_state(SystemState.ERROR)
+        
+        finally:
+            log_debug("Scan loop terminated")
+    
+    async def _scan_loop_async(self):
+        """Main scanning loop as a coroutine on the host's event loop
+        
+        Each iteration is the same blocking _scan_iteration as in _scan_loop,
+        run in the loop's default executor; the coroutine only pauses, waits
+        and stops.
+        """
+        try:
+            consecutive_failures = 0
+            iterations = 0
+            loop = asyncio.get_running_loop()
+            self._ready_event.set()
+            
+            from statistics_manager import get_stats_manager
+            stats_manager = get_stats_manager()
+            stop_is_set = self._async_stop.is_set
+            
+            # Set initial next scan time for countdown
+            stats_manager.set_next_scan_time(SCAN_INTERVAL)
+            
+            while not stop_is_set():
+                try:
+                    # Check if paused
+                    if not self._async_resume.is_set():
+                        self.set_current_activity("Paused", "System is paused")
+                        await self._async_resume.wait()  # Woken by resume or stop
+                        continue
                     
-                    # Set next scan time for countdown
-                    from statistics_manager import get_stats_manager
-                    get_stats_manager().set_next_scan_time(SCAN_INTERVAL)
+                    iterations += 1
+                    consecutive_failures = await loop.run_in_executor(
+                        None, self._scan_iteration, stats_manager, consecutive_failures, iterations
+                    )
                     
-                    # Wait for next scan (with interruption check)
-                    self.set_current_activity("Waiting", f"Next scan in {SCAN_INTERVAL}s")
-                    self._wait_for_next_scan()
+                    # Wait for next scan, cut short by a stop
+                    await self._wait_for_next_scan_async(SCAN_INTERVAL)
                     
+                except asyncio.CancelledError:
+                    raise
                 except Exception as e:
                     log_error(f"Error in scan loop: {e}")
                     consecutive_failures += 1
@@ -445,9 +594,11 @@ class SystemController:
                         self._set_state(SystemState.ERROR)
                         break
                     
-                    # Short wait before retry
-                    time.sleep(1.0)
+                    # Short wait before retry, cut short by a stop
+                    await self._wait_for_next_scan_async(1.0)
             
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             log_error(f"Critical error in scan loop: {e}")
             self._set_state(SystemState.ERROR)
@@ -455,39 +606,118 @@ class SystemController:
         finally:
             log_debug("Scan loop terminated")
     
+    def _scan_iteration(self, stats_manager, consecutive_failures: int, iteration: int) -> int:
+        """Run one complete scan and its reporting, returning the updated failure count
+        
+        Blocks for the scan, any click and any extended wait after repeated
+        failures; shared by the threaded and the async scan loops. iteration
+        is the loop's own 1-based count, which schedules status reports.
+        """
+        set_activity = self.set_current_activity
+        
+        # Check system health
+        if not is_system_healthy():
+            log_error("System unhealthy, continuing with caution...")
+        
+        # Get scan number
+        scan_number = get_next_scan_number()
+        self._scan_count = scan_number
+        
+        # Set activity to preparing scan
+        set_activity("Preparing scan", f"Scan #{scan_number}")
+        
+        # Notify scan start callbacks
+        self._notify_scan('scan_start', scan_number=scan_number)
+        
+        # Execute scan with retry
+        set_activity("Scanning", f"Executing scan #{scan_number}")
+        scan_start_time = time.monotonic()
+        success, coordinates = perform_scan_with_retry(scan_number)
+        scan_time = time.monotonic() - scan_start_time
+        
+        self._last_scan_time = datetime.now()
+        self._last_scan_time_iso = self._last_scan_time.isoformat()
+        
+        # Handle scan result
+        click_performed = False
+        if success:
+            set_activity("Processing result", f"Target found, handling click for scan #{scan_number}")
+            click_performed = handle_scan_result(scan_number, success, coordinates)
+            consecutive_failures = 0  # Reset on success
+        else:
+            consecutive_failures += 1
+        
+        # Log scan summary (skip building it when info logging is off)
+        if is_info_enabled():
+            log_scan_summary(scan_number, success, click_performed, scan_time, report_status=False)
+        
+        # Notify scan complete callbacks
+        self._notify_scan(
+            'scan_complete',
+            scan_number=scan_number,
+            success=success,
+            click_performed=click_performed,
+            scan_time=scan_time,
+            coordinates=coordinates
+        )
+        
+        # Handle consecutive failures
+        if consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            handle_consecutive_failures()
+            consecutive_failures = 0  # Reset after handling
+        
+        # Status report every STATUS_REPORT_FREQUENCY loop iterations; scan
+        # numbers skip ahead when retries are counted as scans, so they are
+        # not used here
+        if iteration % STATUS_REPORT_FREQUENCY == 0 and is_info_enabled():
+            log_system_status()
+        
+        # Set next scan time for countdown
+        stats_manager.set_next_scan_time(SCAN_INTERVAL)
+        set_activity("Waiting", f"Next scan in {SCAN_INTERVAL}s")
+        return consecutive_failures
+    
+    def _notify_scan(self, event_type: str, **data):
+        """Send one scan event to all scan callbacks, sharing a single payload dict"""
+        callbacks = self._scan_callbacks
+        if not callbacks:
+            return
+        for _, _, dispatch in callbacks:
+            dispatch(event_type, data)
+    
     def _wait_for_next_scan(self):
         """Wait for next scan with interruption support"""
-        wait_time = SCAN_INTERVAL
-        start_time = time.time()
-        
-        while time.time() - start_time < wait_time:
-            if self._stop_event.is_set():
-                break
-            
-            # Update activity with remaining time
-            remaining_time = wait_time - (time.time() - start_time)
-            if remaining_time > 0:
-                self.set_current_activity("Waiting", f"Next scan in {remaining_time:.1f}s")
-            
-            # Sleep in small increments to allow interruption
-            time.sleep(min(0.5, wait_time - (time.time() - start_time)))
+        # Returns as soon as the stop event is set; the countdown is served
+        # by the statistics manager's next scan time
+        self._stop_event.wait(timeout=SCAN_INTERVAL)
+    
+    async def _wait_for_next_scan_async(self, timeout: float):
+        """Await the next scan on the event loop, returning early on stop"""
+        try:
+            await asyncio.wait_for(self._async_stop.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
 
 # Global instance
 _system_controller: Optional[SystemController] = None
+_controller_lock = threading.Lock()
 
 def get_system_controller() -> SystemController:
     """Get the global system controller instance"""
     global _system_controller
     if _system_controller is None:
-        _system_controller = SystemController()
+        with _controller_lock:
+            if _system_controller is None:
+                _system_controller = SystemController()
     return _system_controller
 
 def cleanup_system_controller():
     """Cleanup the global system controller"""
     global _system_controller
-    if _system_controller is not None:
-        _system_controller.stop_system()
-        _system_controller = None
+    with _controller_lock:
+        controller, _system_controller = _system_controller, None
+    if controller is not None:
+        controller.stop_system()
 
 # Signal handler for graceful shutdown
 def signal_handler(signum, frame):
@@ -501,6 +731,12 @@ def signal_handler(signum, frame):
         print(f"Error during signal handling: {e}")
         sys.exit(1)
 
-# Register signal handlers
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
\ No newline at end of file
+def install_signal_handlers():
+    """Route SIGINT/SIGTERM to an emergency stop of the global controller
+    
+    Not done at import time so that importing this module as a library
+    leaves the host application's handlers alone; applications built on
+    the controller call this once at startup.
+    """
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
\ No newline at end of file
@@ -10,7 +10,13 @@ from PIL import Image
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from config import TARGET_PATTERN, TARGET_END_WORD
-from ocr_engine import extract_all_text_with_positions, find_target_pattern_in_detections
+from ocr_engine import (
+    extract_all_text_with_positions, extract_all_text_with_positions_batch,
+    find_target_pattern_in_detections
+)
+
+# Compiled once and shared by the string tests and every OCR search below
+_PATTERN = re.compile(TARGET_PATTERN, re.IGNORECASE | re.DOTALL)
 
 def test_pattern_matching():
     """Test pattern matching with known OCR results."""
@@ -28,7 +34,7 @@ def test_pattern_matching():
     ]
     
     print("\n=== PATTERN MATCHING TESTS ===")
-    pattern = re.compile(TARGET_PATTERN, re.IGNORECASE | re.DOTALL)
+    pattern = _PATTERN
     
     for test_str in test_strings:
         print(f"\nTesting: {test_str}")
@@ -50,7 +56,7 @@ def test_pattern_matching():
             print(f"Total detections: {len(detections)}")
             
             # Test our pattern matching function
-            coordinates = find_target_pattern_in_detections(detections, TARGET_PATTERN, TARGET_END_WORD)
+            coordinates = find_target_pattern_in_detections(detections, pattern, TARGET_END_WORD)
             
             if coordinates:
                 print(f"✅ TARGET FOUND IN ORIGINAL!")
@@ -73,16 +79,20 @@ def test_pattern_matching():
             
             print(f"Enhanced images generated: {len(enhanced_images)}")
             
+            # OCR all variants in one batch, concurrently, as the scanner does
+            variant_detections = extract_all_text_with_positions_batch(
+                [enhanced_image for _, enhanced_image in enhanced_images]
+            )
+            
             all_detections = []
-            for method_name, enhanced_image in enhanced_images:
+            for (method_name, _), detections in zip(enhanced_images, variant_detections):
                 print(f"\nTesting enhanced image: {method_name}")
                 try:
-                    detections = extract_all_text_with_positions(enhanced_image)
                     print(f"  Detections: {len(detections)}")
                     all_detections.extend(detections)
                     
                     # Test pattern on this enhanced image
-                    coordinates = find_target_pattern_in_detections(detections, TARGET_PATTERN, TARGET_END_WORD)
+                    coordinates = find_target_pattern_in_detections(detections, pattern, TARGET_END_WORD)
                     if coordinates:
                         print(f"  ✅ TARGET FOUND in {method_name}!")
                         for i, coord in enumerate(coordinates):
@@ -98,11 +108,11 @@ def test_pattern_matching():
             print(f"Total combined detections: {len(all_detections)}")
             
             # Deduplicate like the real system
-            from scanner import deduplicate_detections
+            from ocr_engine import deduplicate_detections
             unique_detections = deduplicate_detections(all_detections)
             print(f"After deduplication: {len(unique_detections)}")
             
-            coordinates = find_target_pattern_in_detections(unique_detections, TARGET_PATTERN, TARGET_END_WORD)
+            coordinates = find_target_pattern_in_detections(unique_detections, pattern, TARGET_END_WORD)
             if coordinates:
                 print(f"✅ TARGET FOUND IN COMBINED ENHANCED!")
                 print(f"   Coordinates found: {len(coordinates)}")